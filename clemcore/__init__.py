@@ -1,3 +1,4 @@
+import functools
 import logging.config
 import os
 
@@ -8,7 +9,9 @@ from importlib.metadata import version, PackageNotFoundError
 import clemcore.backends as backends
 
 
+@functools.lru_cache(maxsize=1)
 def get_version():
+    # the installed version cannot change during a run, but the metadata lookup scans the installed distributions
     try:
         return version("clemcore")
     except PackageNotFoundError:
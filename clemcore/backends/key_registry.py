@@ -112,15 +112,19 @@ class KeyRegistry(Mapping):
         return registry
 
     @classmethod
-    def from_json(cls, file_name: str = "key.json", fallback=True) -> "KeyRegistry":
+    def from_json(cls, file_name: str = "key.json", fallback=True, search_dir: Path = None) -> "KeyRegistry":
         """
         Look up key.json in the following locations:
-        (1) Lookup in the current working directory (relative to script execution)
+        (1) Lookup in the search directory (defaults to the current working directory)
         (2) Lookup in the users home .clemcore folder
         If keys are found in the (1) then (2) is ignored.
+        Args:
+            file_name: the name of the key file
+            fallback: whether to look up the key file in the users home .clemcore folder
+            search_dir: the directory to look up first; defaults to the current working directory
         Returns: key registry backed by the json file
         """
-        key_file_path = Path.cwd() / file_name
+        key_file_path = Path(search_dir or Path.cwd()) / file_name
         try:
             with open(key_file_path) as f:
                 return cls(key_file_path, json.load(f))
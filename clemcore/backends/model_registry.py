@@ -1,4 +1,5 @@
 import abc
+import copy
 import hashlib
 import json
 import logging
@@ -130,6 +131,8 @@ class ModelSpec(SimpleNamespace):
         """
         try:
             model_string = model_string.replace("'", "\"")  # make this a proper json
+            if not model_string.lstrip().startswith("{"):  # a simple model name; skip the failing json parse
+                return cls.from_name(model_string)
             model_dict = json.loads(model_string)
             return cls.from_dict(model_dict)
         except Exception as e:  # likely not a json
@@ -417,6 +420,19 @@ class Model(abc.ABC):
         """Human-readable descriptor of this model."""
         return f"{self.name}-t{self.temperature}"
 
+    def __deepcopy__(self, memo):
+        """Deepcopy override method.
+        A model may hold large backend resources (e.g. weights on the GPU or API clients), so that a deep copy is
+        only a shallow copy sharing these resources (and the model spec), but with its own generation arguments.
+        Note: Players and game masters keep the reference to the very same model on deep copies.
+        Args:
+            memo: Dictionary of objects already copied during the current copying pass. (This is a deepcopy default.)
+        """
+        _copy = copy.copy(self)
+        memo[id(self)] = _copy
+        _copy.__gen_args = dict(self.__gen_args)
+        return _copy
+
     @staticmethod
     def to_identifier(player_models: List["Model"]):
         """Generate a unique and (where possible) human-readable identifier for a list of models.
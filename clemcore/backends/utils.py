@@ -2,6 +2,8 @@ import logging
 import copy
 from datetime import datetime
 from functools import wraps
+from itertools import groupby
+from operator import itemgetter
 from typing import List, Dict, Tuple
 
 logger = logging.getLogger(__name__)
@@ -19,59 +21,23 @@ def ensure_alternating_roles(messages: List[Dict], cull_system_message: bool = T
     Returns:
         A new messages list with alternating message roles.
     """
-    _messages = copy.deepcopy(messages)
-
     if cull_system_message:
-        if _messages[0]['role'] == "system" and not _messages[0]["content"]:
-            del _messages[0]
-
-    def is_same_role(msg1, msg2):
-        """Check if two messages have the same role.
-        Args:
-            msg1: The first message to be checked.
-            msg2: The second message to be checked.
-        Returns:
-            True if both messages have the same role, False otherwise.
-        """
-        return msg1["role"] == msg2["role"]
+        if messages[0]['role'] == "system" and not messages[0]["content"]:
+            messages = messages[1:]
 
     delimiter = "\n\n"
 
-    def join_content(msg1, msg2):
-        """Join the content of two messages.
-        Args:
-            msg1: The first message to be checked.
-            msg2: The second message to be checked.
-        Returns:
-            The passed messages, joined with a '\n\n' delimiter.
-        """
-        return f"{msg1['content']}{delimiter}{msg2['content']}"
-
-    if len(_messages) <= 1:
-        return _messages
-
-    def is_valid(idx):
-        """Check if a message index is valid.
-        Args:
-            idx: The message index.
-        Returns:
-            True if the message index is inside the bounds of the message list.
-        """
-        return idx < len(_messages)
-
-    msg_idx = 1
-    while is_valid(msg_idx):
-        prev_message = _messages[msg_idx - 1]
-        message = _messages[msg_idx]
-        if is_same_role(prev_message, message):
-            msg = (f"Found consecutive role assignments. These will be merged into one:\n"
-                   f"{prev_message}\n"
-                   f"{message}")
-            logger.debug(msg)
-            prev_message['content'] = join_content(prev_message, message)
-            del _messages[msg_idx]
-        else:
-            msg_idx += 1
+    # Merge each run of same-role messages at once (instead of pairwise), so long runs are joined in linear time
+    _messages = []
+    for _, same_role_messages in groupby(messages, key=itemgetter("role")):
+        message = copy.deepcopy(next(same_role_messages))  # keeps the first message's extras, e.g. images
+        consecutive_messages = list(same_role_messages)
+        if consecutive_messages:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Found consecutive role assignments. These will be merged into one:\n%s",
+                             "\n".join(str(m) for m in [message, *consecutive_messages]))
+            message["content"] = delimiter.join(str(m["content"]) for m in [message, *consecutive_messages])
+        _messages.append(message)
 
     return _messages
 
@@ -5,14 +5,16 @@ This script produces the main table with benchmark results, for all models
 and games in the given results directory structure.
 
 """
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
 import pandas as pd
 from tqdm import tqdm
 
 import clemcore.clemgame.metrics as clemmetrics
+from clemcore.clemgame.resources import parse_json
 
 TABLE_NAME = 'results'
 
@@ -102,11 +104,28 @@ def name_as_tuple(name: dict) -> tuple:
     return (name['game'], name['model'], name['experiment'], name['episode'])
 
 
-def load_json(path: Path) -> dict:
+def load_json(path: str | Path) -> dict:
     """Load a json file."""
-    with open(path, 'r') as file:
-        data = json.load(file)
-    return data
+    with open(path, 'rb') as file:  # bytes can be parsed directly without decoding to str first
+        data = file.read()
+    return parse_json(data)  # uses orjson, if available
+
+
+def find_score_files(path: str | Path) -> Iterator[str]:
+    """Recursively yield the paths of all *scores.json files below the given directory.
+
+    Symlinked directories are not followed (as with glob) and unreadable directories are skipped.
+    """
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from find_score_files(entry.path)
+            elif entry.name.endswith("scores.json"):
+                yield entry.path
 
 
 def parse_directory_name(name: Path) -> dict:
@@ -120,20 +139,29 @@ def parse_directory_name(name: Path) -> dict:
             'episode': episode}
 
 
-def load_scores(path: str) -> dict:
-    """Get all turn and episodes scores and return them in a dictionary."""
-    # https://stackoverflow.com/a/18394205
-    score_files = list(Path(path).rglob("*scores.json"))
+def load_scores(path: str, max_workers: int | None = None) -> dict:
+    """Get all turn and episodes scores and return them in a dictionary.
+
+    Args:
+        path: The results directory to search for scores files.
+        max_workers: The number of threads used to load the files. Defaults to the ThreadPoolExecutor default.
+    """
+    score_files = list(find_score_files(path))
     print(f'Loading {len(score_files)} JSON files.')
-    scores = {}
-    for path in tqdm(score_files, desc="Loading scores"):
+    files_by_naming = {}
+    for path in score_files:
         naming = name_as_tuple(parse_directory_name(path))
-        if naming not in scores:
-            data = load_json(path)
-            scores[naming] = {}
-            scores[naming]['episodes'] = data['episode scores']
+        if naming not in files_by_naming:
+            files_by_naming[naming] = path
         else:
             print(f'Repeated file {naming}!')
+    scores = {}
+    # the files are independent of each other, so we read them concurrently (mostly waiting for I/O)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        loaded = executor.map(load_json, files_by_naming.values())
+        for naming, data in tqdm(zip(files_by_naming, loaded), total=len(files_by_naming), desc="Loading scores"):
+            scores[naming] = {}
+            scores[naming]['episodes'] = data['episode scores']
     print(f'Retrieved {len(scores)} JSON files with scores.')
     return scores
 
@@ -141,14 +169,16 @@ def load_scores(path: str) -> dict:
 def build_df_episode_scores(scores: dict) -> pd.DataFrame:
     """Create dataframe with all episode scores."""
     cols = ['game', 'model', 'experiment', 'episode', 'metric', 'value']
-    df_episode_scores = pd.DataFrame(columns=cols)
+    rows = []
     desc = "Build episode scores dataframe"
     for name, data in tqdm(scores.items(), desc=desc):
         (game, model, experiment, episode) = name
         for metric_name, metric_value in data['episodes'].items():
             new_row = [game, model, experiment, episode,
                        metric_name, metric_value]
-            df_episode_scores.loc[len(df_episode_scores)] = new_row
+            rows.append(new_row)
+    # build the dataframe at once; appending via df.loc[len(df)] re-allocates the frame for every row
+    df_episode_scores = pd.DataFrame(rows, columns=cols)
     return df_episode_scores
 
 
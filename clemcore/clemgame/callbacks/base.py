@@ -1,12 +1,12 @@
 import abc
 from dataclasses import dataclass, field
-from typing import List, TYPE_CHECKING, Dict
+from typing import List, TYPE_CHECKING, Dict, Callable, Optional
 
 if TYPE_CHECKING:  # to satisfy pycharm
     from clemcore.clemgame import GameMaster, GameBenchmark
 
 
-@dataclass
+@dataclass(slots=True)  # one per step, so avoid the per-instance dict
 class GameStep:
     context: dict
     response: str
@@ -28,37 +28,64 @@ class GameBenchmarkCallback(abc.ABC):
     def on_game_end(self, game_master: "GameMaster", game_instance: Dict):
         pass
 
+    def on_game_error(self, game_master: "GameMaster", game_instance: Dict):
+        """Called instead of on_game_end(), when a started game is aborted due to an exception."""
+        pass
+
     def on_benchmark_end(self, game_benchmark: "GameBenchmark"):
         pass
 
 
 class GameBenchmarkCallbackList(GameBenchmarkCallback):
+    _HOOKS = ("on_benchmark_start", "on_game_start", "on_game_step", "on_game_end", "on_game_error",
+              "on_benchmark_end")
 
     def __init__(self, callbacks: List[GameBenchmarkCallback] = None):
         super().__init__()
         if callbacks is None:
             callbacks = []
         self.callbacks = callbacks
+        self._handled_callbacks: Optional[List[GameBenchmarkCallback]] = None  # the callbacks of the handlers
+        self._handlers: Dict[str, List[Callable]] = {}
+
+    def _get_handlers(self, hook: str) -> List[Callable]:
+        """Returns the bound methods of the callbacks that actually override the hook.
+
+        The hooks are called for every game step, so we skip the no-op base implementations. The handlers are
+        collected again, whenever the (public) callbacks list was changed or replaced in the meantime.
+        """
+        if self.callbacks != self._handled_callbacks:  # cheap: compares the few callbacks by identity first
+            self._handled_callbacks = list(self.callbacks)
+            for name in self._HOOKS:
+                base_function = getattr(GameBenchmarkCallback, name)
+                handlers = (getattr(callback, name) for callback in self._handled_callbacks)
+                self._handlers[name] = [handler for handler in handlers
+                                        if getattr(handler, "__func__", None) is not base_function]
+        return self._handlers[hook]
 
     def append(self, callback: GameBenchmarkCallback):
         self.callbacks.append(callback)
 
     def on_benchmark_start(self, game_benchmark: "GameBenchmark"):
-        for callback in self.callbacks:
-            callback.on_benchmark_start(game_benchmark)
+        for handler in self._get_handlers("on_benchmark_start"):
+            handler(game_benchmark)
 
     def on_game_start(self, game_master: "GameMaster", game_instance: Dict):
-        for callback in self.callbacks:
-            callback.on_game_start(game_master, game_instance)
+        for handler in self._get_handlers("on_game_start"):
+            handler(game_master, game_instance)
 
     def on_game_step(self, game_master: "GameMaster", game_instance: Dict, game_step: GameStep):
-        for callback in self.callbacks:
-            callback.on_game_step(game_master, game_instance, game_step)
+        for handler in self._get_handlers("on_game_step"):
+            handler(game_master, game_instance, game_step)
 
     def on_game_end(self, game_master: "GameMaster", game_instance: Dict):
-        for callback in self.callbacks:
-            callback.on_game_end(game_master, game_instance)
+        for handler in self._get_handlers("on_game_end"):
+            handler(game_master, game_instance)
+
+    def on_game_error(self, game_master: "GameMaster", game_instance: Dict):
+        for handler in self._get_handlers("on_game_error"):
+            handler(game_master, game_instance)
 
     def on_benchmark_end(self, game_benchmark: "GameBenchmark"):
-        for callback in self.callbacks:
-            callback.on_benchmark_end(game_benchmark)
+        for handler in self._get_handlers("on_benchmark_end"):
+            handler(game_benchmark)
@@ -1,3 +1,4 @@
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, TYPE_CHECKING, Any
@@ -7,7 +8,7 @@ from clemcore import get_version
 if TYPE_CHECKING:  # to satisfy pycharm
     from clemcore.clemgame import GameMaster, GameBenchmark
 
-from clemcore.clemgame.recorder import GameInteractionsRecorder, EventCallRecorder
+from clemcore.clemgame.recorder import GameInteractionsRecorder, EventCallRecorder, store_interactions
 from clemcore.clemgame.callbacks.base import GameBenchmarkCallback
 from clemcore.clemgame.resources import store_json, load_json, module_logger
 
@@ -205,10 +206,20 @@ class ExperimentFileSaver(GameBenchmarkCallback):
 
 
 class InteractionsFileSaver(GameBenchmarkCallback):
+    """
+    Records the interactions of each game and stores them as interactions.json in the instance directory.
 
-    def __init__(self, results_folder: ResultsFolder, *, player_model_infos: Any = None):
+    With stream_interactions=True, the turns are appended to an interactions.jsonl file during gameplay
+    (instead of being kept in memory) and converted to the interactions.json at the end of the game.
+    Note: Streaming recorders cannot be deep copied, so that streaming does not work with branching game masters.
+    For aborted games, no interactions.json is stored; a streamed interactions.jsonl is closed and kept as it is.
+    """
+
+    def __init__(self, results_folder: ResultsFolder, *, player_model_infos: Any = None,
+                 stream_interactions: bool = False):
         self.results_folder = results_folder
         self.player_models_infos = player_model_infos
+        self.stream_interactions = stream_interactions
         self._recorders: Dict[str, GameInteractionsRecorder] = {}
 
     @staticmethod
@@ -219,12 +230,17 @@ class InteractionsFileSaver(GameBenchmarkCallback):
         game_name = game_master.game_spec.game_name
         experiment_name = game_master.experiment["name"]
         game_id = game_instance["game_id"]
+        stream_path = None
+        if self.stream_interactions:
+            instance_dir_path = self.results_folder.to_instance_dir_path(game_master, game_instance)
+            stream_path = str(instance_dir_path / "interactions.jsonl")
         # create, inject and register new game recorder
         game_recorder = GameInteractionsRecorder(game_name,
                                                  experiment_name,  # meta info for transcribe
                                                  game_id,  # meta info for transcribe
                                                  self.results_folder.run_dir,  # meta info for transcribe
-                                                 self.player_models_infos)
+                                                 self.player_models_infos,
+                                                 stream_path=stream_path)
         for player in game_master.get_players():
             game_recorder.log_player(player.name, player.game_role, player.model.name)
         game_master.register(game_recorder)
@@ -240,7 +256,21 @@ class InteractionsFileSaver(GameBenchmarkCallback):
         assert _key in self._recorders, f"Recorder must be registered on_game_start, but wasn't for: {_key}"
         recorder = self._recorders.pop(_key)  # auto-remove recorder from registry
         instance_dir_path = self.results_folder.to_instance_dir_path(game_master, game_instance)
-        store_json(recorder.interactions, "interactions.json", instance_dir_path)
+        if recorder.stream_path is not None:
+            recorder.close()
+            store_interactions(recorder.stream_path, str(instance_dir_path / "interactions.json"))
+            os.remove(recorder.stream_path)
+        else:
+            store_json(recorder.to_dict(), "interactions.json", instance_dir_path)
+
+    def on_game_error(self, game_master: "GameMaster", game_instance: Dict):
+        game_name = game_master.game_spec.game_name
+        experiment_name = game_master.experiment["name"]
+        game_id = game_instance["game_id"]
+        _key = InteractionsFileSaver.to_key(game_name, experiment_name, game_id)
+        recorder = self._recorders.pop(_key, None)  # the game might have failed before on_game_start
+        if recorder is not None:
+            recorder.close()  # writes the trailer, so that the partial interactions.jsonl can still be loaded
 
 
 class PlayerFileSaver(GameBenchmarkCallback):
@@ -266,8 +296,9 @@ class PlayerFileSaver(GameBenchmarkCallback):
                 game_role=player.game_role,
                 model_name=player.model.name
             )
-            game_master.register(recorder)  # for lifecycle events (log_next_round, log_game_end)
-            player.register(recorder)  # for call events (log_event with call tuple)
+            # the recorder only keeps events from its player, so the other events are not delegated at all
+            game_master.register(recorder, from_=player.name)  # for lifecycle events (log_next_round, log_game_end)
+            player.register(recorder, from_=player.name)  # for call events (log_event with call tuple)
             _key = PlayerFileSaver.to_key(game_name, experiment_name, game_id, player.name)
             self._recorders[_key] = recorder
 
@@ -275,6 +306,7 @@ class PlayerFileSaver(GameBenchmarkCallback):
         game_name = game_master.game_spec.game_name
         experiment_name = game_master.experiment["name"]
         game_id = game_instance["game_id"]
+        instance_dir_path = self.results_folder.to_instance_dir_path(game_master, game_instance)  # same for all
         for player in game_master.get_players():
             _key = PlayerFileSaver.to_key(game_name, experiment_name, game_id, player.name)
             recorder = self._recorders.pop(_key, None)  # discontinue recording with this recorder
@@ -282,6 +314,5 @@ class PlayerFileSaver(GameBenchmarkCallback):
                 module_logger.error(f"Recorder must be registered on_game_start, but wasn't for: {_key}")
                 continue
             if len(recorder) > 0:  # only store non-empty recordings because Players might act outside the loop
-                instance_dir_path = self.results_folder.to_instance_dir_path(game_master, game_instance)
                 file_name = "_".join(player.name.lower().strip().split(" "))  # e.g., Player 1 -> player_1
-                store_json(recorder.requests, f"{file_name}.requests.json", instance_dir_path)
+                store_json(recorder.to_dict(), f"{file_name}.requests.json", instance_dir_path)
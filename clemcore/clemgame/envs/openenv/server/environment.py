@@ -1,3 +1,4 @@
+import functools
 import logging
 from dataclasses import asdict
 from typing import Dict, Any
@@ -15,6 +16,17 @@ from clemcore.clemgame.instances import to_instance_filter
 module_logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _load_instance_filter(game_instance_split: str):
+    """Loads the playpen instances split and turns it into an instance filter.
+
+    Cached, so that creating several environments for the same split in one process
+    (e.g. one per game) does not repeat the dataset load and the filter construction.
+    """
+    dataset = load_dataset("colab-potsdam/playpen-data", "instances", split=game_instance_split)
+    return to_instance_filter(dataset)
+
+
 class ClemGameEnvironment(Environment):
 
     def __init__(self,
@@ -40,8 +52,7 @@ class ClemGameEnvironment(Environment):
         game_instance_filter = None  # use all the default game instances of the game
         if game_instance_split:
             # We only use the training instances so that we can properly evaluate on the validation set later
-            dataset = load_dataset("colab-potsdam/playpen-data", "instances", split=game_instance_split)
-            game_instance_filter = to_instance_filter(dataset)
+            game_instance_filter = _load_instance_filter(game_instance_split)
 
         # Finally, load the opponent models, which can take a long time for large models
         if game_spec.is_multi_player():  # if single_player env_agents should be None; or check has failed above
@@ -149,6 +149,7 @@ class GameMasterEnv(AECEnv):
         # GM.setup() adds players, i.e., is not idempotent. Therefore, we create a new GM instance here.
         self.experiment = self.options["experiment"]
         self.game_instance = self.options["game_instance"]
+        self.game_master = None  # so that a failing reset does not leave the previous game master behind
         player_models = (self.options.get("player_models", None)
                          or [CustomResponseModel()] * self.game_benchmark.game_spec.players)
         self.game_master: GameMaster = self.game_benchmark.create_game_master(self.experiment, player_models)
@@ -1,5 +1,5 @@
 import abc
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Optional
 import json
 
 
@@ -106,15 +106,20 @@ class GameEventSource(GameEventLogger):
         Initialize a new GameEventSource with no registered loggers.
         """
         self._loggers: List[GameEventLogger] = []
+        # the loggers receiving log_event calls by origin (from_); None for the loggers that receive all events
+        self._event_loggers: Dict[Optional[str], List[GameEventLogger]] = {None: []}
 
-    def register(self, logger: GameEventLogger):
+    def register(self, logger: GameEventLogger, *, from_: Optional[str] = None):
         """
         Register a new GameEventLogger to receive delegated event notifications.
 
         Args:
             logger: An instance implementing GameEventLogger to register.
+            from_: If given, only events originating from this identifier are delegated to the logger's log_event.
+                   All other notifications are delegated regardless.
         """
         self._loggers.append(logger)
+        self._event_loggers.setdefault(from_, []).append(logger)
 
     def register_many(self, loggers: List[GameEventLogger]):
         """
@@ -124,6 +129,7 @@ class GameEventSource(GameEventLogger):
             loggers: A list of GameEventLogger instances to register.
         """
         self._loggers.extend(loggers)
+        self._event_loggers[None].extend(loggers)
 
     def log_next_round(self):
         """Delegate notification of a new round to all registered loggers."""
@@ -160,7 +166,9 @@ class GameEventSource(GameEventLogger):
             action: Event action details.
             call: Optional associated API call information.
         """
-        for logger in self._loggers:
+        for logger in self._event_loggers[None]:
+            logger.log_event(from_, to, action, call)
+        for logger in self._event_loggers.get(from_, ()):
             logger.log_event(from_, to, action, call)
 
     def log_key(self, key: str, value: Any):
@@ -4,7 +4,7 @@ import logging
 import os
 import random
 from copy import copy
-from typing import Dict, final, Optional, Callable, List, Tuple
+from typing import Dict, final, Optional, Callable, List, Tuple, Deque
 
 import numpy as np
 from clemcore.clemgame.registry import GameSpec
@@ -19,16 +19,26 @@ def to_instance_filter(dataset) -> Callable[[str, str], List[int]]:
     Converts the given dataset into a game instance filter function.
 
     Args:
-        dataset: a list of dict-like rows with game, experiment, task_id values
+        dataset: a list of dict-like rows with game, experiment, task_id values, or a (huggingface) dataset
+            with game, experiment, task_id columns
 
     Returns:
         A callable mapping of (game_name, experiment_name) tuples to lists of task ids (game instance ids)
     """
+    if hasattr(dataset, "select_columns"):
+        # For datasets, read the columns at once instead of materializing a dict for each row
+        columns = dataset.select_columns(["game", "experiment", "task_id"]).to_dict()
+        games, experiments, task_ids = columns["game"], columns["experiment"], columns["task_id"]
+    else:
+        games = [row['game'] for row in dataset]
+        experiments = [row['experiment'] for row in dataset]
+        task_ids = [row['task_id'] for row in dataset]
+    task_ids = np.asarray(task_ids).astype(int).tolist()  # cast all at once
     tasks_by_group = collections.defaultdict(list)
-    for row in dataset:
-        key = (row['game'], row['experiment'])
-        tasks_by_group[key].append(int(row['task_id']))
-    return lambda game, experiment: tasks_by_group[(game, experiment)]
+    for key, task_id in zip(zip(games, experiments), task_ids):
+        tasks_by_group[key].append(task_id)
+    tasks_by_group = dict(tasks_by_group)  # lookups of unknown games should not insert empty entries
+    return lambda game, experiment: tasks_by_group.get((game, experiment), [])
 
 
 class GameInstanceIterator:
@@ -62,14 +72,14 @@ class GameInstanceIterator:
         self._game_name = game_name
         self._instances: Dict = instances
         self._sub_selector: Optional[Callable[[str, str], List[int]]] = sub_selector
-        self._queue = []
+        self._queue: Deque[Tuple[Dict, Dict]] = collections.deque()
 
     def __iter__(self):
         return self
 
     def __next__(self) -> Tuple[Dict, Dict]:
         try:
-            return self._queue.pop(0)
+            return self._queue.popleft()
         except IndexError:
             raise StopIteration()
 
@@ -85,7 +95,7 @@ class GameInstanceIterator:
         return _copy
 
     def reset(self, verbose: bool = False) -> "GameInstanceIterator":
-        self._queue = []
+        self._queue = collections.deque()
         experiment_names = []
         num_instances = 0
         for index, experiment in enumerate(self._instances["experiments"]):
@@ -107,6 +117,7 @@ class GameInstanceIterator:
                         stdout_logger.info("Sub-select for %s experiment %s instances with game_ids: %s",
                                            self._game_name, experiment["name"], selected_ids)
             # add instances to queue, if eligible
+            selected_ids = None if selected_ids is None else set(selected_ids)  # constant time membership checks
             for game_instance in experiment["game_instances"]:
                 if selected_ids is None or game_instance["game_id"] in selected_ids:
                     self._queue.append((filtered_experiment, game_instance))
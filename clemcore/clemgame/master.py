@@ -39,6 +39,25 @@ class GameMaster(GameEventSource):
         self.game_resources = GameResourceLocator(game_spec.game_name, game_spec.game_path)
         self._current_player: Player | None = None
 
+    # attributes that are not changed during gameplay and thus shared between a game master and its (deep) copies
+    _SHARED_ON_DEEPCOPY = ("game_spec", "player_models", "game_resources")
+
+    def __deepcopy__(self, memo):
+        """Deepcopy override method.
+        Deep copies the game state (players, contexts, loggers) and the experiment, which game masters may modify,
+        but keeps the references to the game spec, the game resources and the player models intact.
+        Args:
+            memo: Dictionary of objects already copied during the current copying pass. (This is a deepcopy default.)
+        """
+        _copy = type(self).__new__(self.__class__)
+        memo[id(self)] = _copy
+        for key, value in self.__dict__.items():
+            if key in type(self)._SHARED_ON_DEEPCOPY:
+                setattr(_copy, key, value)
+            else:
+                setattr(_copy, key, deepcopy(value, memo))
+        return _copy
+
     @property
     def current_player(self) -> Player:
         """Get the current player whose turn it is.
@@ -56,16 +56,20 @@ class Player(GameEventSource):
         """Deepcopy override method.
         Deep copies Player class object, but keeps backend model and game recorder references intact.
         We don't want to multiply the recorders on each deep copy, but have a single set for each game.
+        The message history is copied on write: the copy gets its own list, but shares the messages already
+        in there, because memorized messages are only ever appended, but never changed afterwards.
         Args:
             memo: Dictionary of objects already copied during the current copying pass. (This is a deepcopy default.)
         """
         _copy = type(self).__new__(self.__class__)
         memo[id(self)] = _copy
         for key, value in self.__dict__.items():
-            if key not in ["_model", "_loggers"]:
+            if key not in ["_model", "_loggers", "_event_loggers", "_messages"]:
                 setattr(_copy, key, deepcopy(value, memo))
+        _copy._messages = list(self._messages)
         _copy._model = self._model
         _copy._loggers = []  # we don't want to copy loggers, but the list must be initialized
+        _copy._event_loggers = {None: []}
         return _copy
 
     @property
@@ -167,7 +171,8 @@ class Player(GameEventSource):
                       'label': "response" if memorize else "forget"}
             call_infos = None
             if metadata is not None:  # log 'get message' event including backend/API call
-                call_infos = (deepcopy(metadata["prompt"]), deepcopy(metadata["response_object"]))
+                # no need to copy here: recorders that keep the call objects take their own copy
+                call_infos = (metadata["prompt"], metadata["response_object"])
             self.log_event(from_=self.name, to="GM", action=action, call=call_infos)
         self.count_request()
         if memorize:
@@ -1,8 +1,13 @@
 import collections
 import copy
+import json
 import logging
+import os
+import pickle
+import time
+import warnings
 from datetime import datetime
-from typing import Dict, Tuple, Any, List
+from typing import Dict, Tuple, Any, List, Optional
 
 from clemcore.clemgame.events import GameEventLogger
 from clemcore.clemgame.metrics import METRIC_REQUEST_COUNT, METRIC_REQUEST_COUNT_VIOLATED, METRIC_REQUEST_COUNT_PARSED
@@ -11,15 +16,183 @@ from clemcore import get_version
 module_logger = logging.getLogger(__name__)
 
 
+def _copy_call_obj(obj: Any) -> Any:
+    """Deep copy a call object, so that the recorded call is protected from later mutations of the original object.
+
+    A pickle round-trip is implemented in C and several times faster than copy.deepcopy for the typical
+    prompt and response objects (nested dicts and lists of strings). Objects that cannot be pickled fall back
+    to copy.deepcopy.
+    """
+    try:
+        return pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return copy.deepcopy(obj)
+
+
+def _isoformat_ns(timestamp_ns: int) -> str:
+    """Convert a time.time_ns() timestamp into the (local time) ISO format as given by datetime.now().isoformat()."""
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000).isoformat()
+
+
+def _with_isoformat_timestamp(obj: Dict) -> Dict:
+    """Return a shallow copy of the recorded object with its timestamp converted to ISO format."""
+    return {**obj, "timestamp": _isoformat_ns(obj["timestamp"])}
+
+
+class _Event:
+    """A recorded game event. Uses slots, because an episode keeps thousands of these in memory."""
+    __slots__ = ("from_", "to", "timestamp", "action")
+
+    def __init__(self, from_: str, to: str, timestamp: int, action: Dict):
+        self.from_ = from_
+        self.to = to
+        self.timestamp = timestamp
+        self.action = action
+
+    def to_dict(self) -> Dict:
+        """Materialize the event as stored in the interactions.json (with ISO format timestamp)."""
+        return {
+            "from": self.from_,
+            "to": self.to,
+            "timestamp": _isoformat_ns(self.timestamp),
+            "action": self.action
+        }
+
+
+_TRAILER_PREFIX = '{"trailer"'  # the trailer lines are written as dict(trailer=...), see close()
+
+
+def _read_trailer(stream_path: str) -> Dict:
+    """Return the trailer of the stream file; the event lines are not parsed.
+
+    Raises:
+        ValueError: If the file has no trailer, that is, the recorder was never closed.
+    """
+    trailer = None
+    with open(stream_path, encoding="utf-8") as f:
+        for line in f:
+            if line.startswith(_TRAILER_PREFIX):
+                trailer = json.loads(line)["trailer"]
+    if trailer is None:
+        raise ValueError(f"No trailer found in {stream_path}: the recorder was not closed.")
+    return trailer
+
+
+def _iter_stream_events(stream_path: str):
+    """Yield (round, event) tuples from the stream file; the events are given with ISO format timestamps."""
+    with open(stream_path, encoding="utf-8") as f:
+        for line in f:
+            if line.startswith(_TRAILER_PREFIX):
+                continue
+            record = json.loads(line)
+            yield record["round"], _with_isoformat_timestamp(record["event"])
+
+
+def _read_stream_turns(stream_path: str, round_count: int) -> List[List[Dict]]:
+    turns = [[]]
+    for round_idx, event in _iter_stream_events(stream_path):
+        while len(turns) <= round_idx:
+            turns.append([])
+        turns[round_idx].append(event)
+    while len(turns) < round_count:
+        turns.append([])
+    return turns
+
+
+def _with_turns(entries: Dict, turns: Any) -> Dict:
+    """Return the interactions entries with the turns inserted directly after the players."""
+    interactions = {}
+    for key, value in entries.items():
+        interactions[key] = value
+        if key == "players":
+            interactions["turns"] = turns
+    if "turns" not in interactions:
+        interactions["turns"] = turns
+    return interactions
+
+
+def load_interactions(stream_path: str) -> Dict:
+    """Reconstruct the interactions dict from a file written by a streaming GameInteractionsRecorder.
+
+    Args:
+        stream_path: The path to the interactions.jsonl file.
+    Returns:
+        The interactions dict in the same format as GameInteractionsRecorder.to_dict().
+    """
+    trailer = _read_trailer(stream_path)
+    round_count = trailer.get("meta", {}).get("round_count") or 1
+    return _with_turns(trailer, _read_stream_turns(stream_path, round_count))
+
+
+def store_interactions(stream_path: str, file_path: str):
+    """Convert a file written by a streaming GameInteractionsRecorder into the interactions.json format.
+
+    The events are written out one by one, so that the turns are never held in memory as a whole.
+
+    Args:
+        stream_path: The path to the interactions.jsonl file.
+        file_path: The path to the interactions.json file to write.
+    """
+    trailer = _read_trailer(stream_path)
+    round_count = trailer.get("meta", {}).get("round_count") or 1
+
+    def write_turns(f):
+        f.write('"turns": [\n[')
+        current_round, first_in_round = 0, True
+        for round_idx, event in _iter_stream_events(stream_path):
+            while current_round < round_idx:
+                f.write("],\n[")
+                current_round, first_in_round = current_round + 1, True
+            if not first_in_round:
+                f.write(",\n")
+            f.write(json.dumps(event, ensure_ascii=False))
+            first_in_round = False
+        while current_round + 1 < round_count:
+            f.write("],\n[")
+            current_round += 1
+        f.write("]\n]")
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        entries = list(_with_turns(trailer, None).items())
+        for idx, (key, value) in enumerate(entries):
+            if key == "turns":
+                write_turns(f)
+            else:
+                f.write(f"{json.dumps(key)}: {json.dumps(value, ensure_ascii=False, indent=2)}")
+            f.write(",\n" if idx < len(entries) - 1 else "\n")
+        f.write("}\n")
+
+
 class GameInteractionsRecorder(GameEventLogger):
-    """Default game recorder with common methods for recording game interactions during gameplay."""
+    """Default game recorder with common methods for recording game interactions during gameplay.
+
+    When a stream_path is given, the turns are not kept in memory, but appended as JSON lines to the file at
+    stream_path; only the last few events are kept in memory (see tail). Call close() to write the remaining
+    interactions entries (meta, players, keys) as a trailer line and use store_interactions() to convert the file
+    into an interactions.json (or load_interactions() to read it back).
+
+    Note: A streaming recorder cannot be deep copied, because the copies would write to the same file.
+    """
 
     def __init__(self, game_name: str, experiment_name: str, game_id: int, results_folder: str,
-                 player_model_infos: Dict):
+                 player_model_infos: Dict, stream_path: Optional[str] = None, tail_size: int = 10):
         self._game_name = game_name
         self._current_round = 0
+        self._stream = None
+        self._stream_path = stream_path
+        self._streaming = stream_path is not None
+        self._tail = None
+        if self._streaming:
+            self._tail = collections.deque(maxlen=tail_size)  # the last few JSON lines written to the stream
+            stream_dir = os.path.dirname(stream_path)
+            if stream_dir:
+                os.makedirs(stream_dir, exist_ok=True)
+            # events are only appended; the file is truncated once so that re-runs do not mix up episodes
+            self._stream = open(stream_path, "w", encoding="utf-8", buffering=1 << 16)
         """ Stores players and turn during the runs """
-        self.interactions = {
+        self._interactions = {
             "meta": dict(game_name=game_name,
                          experiment_name=experiment_name,
                          game_id=game_id,
@@ -29,31 +202,47 @@ class GameInteractionsRecorder(GameEventLogger):
                          completed=None),
             "player_models": player_model_infos,
             # already add Game Master
-            "players": collections.OrderedDict(GM=dict(game_role="Game Master", model_name="programmatic")),
-            # already prepare to log the first round of turns
-            "turns": [[]]
+            "players": {"GM": {"game_role": "Game Master", "model_name": "programmatic"}}
         }
+        # the recorded events per round; these are only materialized as dicts on to_dict()
+        self._turns: List[List[_Event]] = []
+        if not self._streaming:  # otherwise, turns are written to the stream
+            # already prepare to log the first round of turns
+            self._turns.append([])
         """ Keep track of player response metrics"""
         self.requests_counts = [0]  # count per round (initially zero)
         self.violated_requests_counts = [0]  # count per round (initially zero)
         self.successful_requests_counts = [0]  # count per round (initially zero)
+        # counts for the current round; added to the per round counts on log_next_round and log_game_end
+        self._pending_requests = 0
+        self._pending_violations = 0
+
+    def _drain_pending_counts(self):
+        """Add the counts of the current round to the per round counts."""
+        self.requests_counts[self._current_round] += self._pending_requests
+        self.violated_requests_counts[self._current_round] += self._pending_violations
+        self.successful_requests_counts[self._current_round] += self._pending_requests - self._pending_violations
+        self._pending_requests = 0
+        self._pending_violations = 0
 
     def log_next_round(self):
         """Call this method to group interactions per turn."""
+        self._drain_pending_counts()
         self._current_round += 1
-        self.interactions["meta"]["round_count"] = self._current_round + 1
-        self.interactions["turns"].append([])
+        self._interactions["meta"]["round_count"] = self._current_round + 1
+        if self._streaming:
+            self._stream.flush()  # flush once per round, but not on every event
+        else:
+            self._turns.append([])
         self.requests_counts.append(0)
         self.violated_requests_counts.append(0)
         self.successful_requests_counts.append(0)
 
     def count_request_violation(self):
-        self.violated_requests_counts[self._current_round] += 1
-        self.successful_requests_counts[self._current_round] -= 1
+        self._pending_violations += 1  # revokes a successful request
 
     def count_request(self):
-        self.requests_counts[self._current_round] += 1
-        self.successful_requests_counts[self._current_round] += 1  # until parse error detected
+        self._pending_requests += 1  # successful until parse error detected
 
     def log_key(self, key: str, value: Any):
         """Add a key and value to the internal log.
@@ -61,8 +250,8 @@ class GameInteractionsRecorder(GameEventLogger):
             key: A string to identify the kind of log entry to be made.
             value: The content of the entry to be logged.
         """
-        self.interactions[key] = value
-        module_logger.info(f"{self._game_name}: Logged a game-specific interaction key: {key}.")
+        self._interactions[key] = value
+        module_logger.info("%s: Logged a game-specific interaction key: %s.", self._game_name, key)
 
     def log_player(self, player_name: str, game_role: str, model_name: str):
         """Log a player of this game episode.
@@ -76,8 +265,8 @@ class GameInteractionsRecorder(GameEventLogger):
             "game_role": game_role,
             "model_name": model_name
         }
-        self.interactions["players"][player_name] = player_info
-        module_logger.info(f"{self._game_name}: Logged {player_name}: {player_info}")
+        self._interactions["players"][player_name] = player_info
+        module_logger.info("%s: Logged %s: %s", self._game_name, player_name, player_info)
 
     def log_event(self, from_: str, to: str, action: Dict, call: Tuple[Any, Any] = None):
         """Add an event to the internal log.
@@ -90,30 +279,88 @@ class GameInteractionsRecorder(GameEventLogger):
                 manipulation) as passed to the API and the second element is the raw response object as returned by the
                 API.
         """
-        timestamp = datetime.now().isoformat()
-        action_obj = {
-            "from": from_,
-            "to": to,
-            "timestamp": timestamp,
-            "action": action
-        }
-        self.interactions["turns"][self._current_round].append(copy.deepcopy(action_obj))
-        module_logger.debug(
-            f"{self._game_name}: Logged {action['type']} action ({from_}->{to}).")
+        # the timestamp is converted to ISO format only on serialization, see to_dict()
+        timestamp = time.time_ns()
+        if self._streaming:  # serialized right away, so later mutations of the action do not affect the record
+            action_obj = {"from": from_, "to": to, "timestamp": timestamp, "action": action}
+            line = json.dumps(dict(round=self._current_round, event=action_obj), ensure_ascii=False)
+            self._stream.write(line)
+            self._stream.write("\n")
+            self._tail.append(line)
+        else:
+            # the action content might reference mutable game state (see GameMaster.log_to_self), so we keep a copy
+            event = _Event(from_, to, timestamp, _copy_call_obj(action))
+            self._turns[self._current_round].append(event)
+        if module_logger.isEnabledFor(logging.DEBUG):
+            module_logger.debug("%s: Logged %s action (%s->%s).", self._game_name, action['type'], from_, to)
+
+    def __deepcopy__(self, memo):
+        """Deepcopy override method. Refuses to copy a streaming recorder, because its copies would write to
+        the same stream file. Other recorders are deep copied as usual.
+        Args:
+            memo: Dictionary of objects already copied during the current copying pass. (This is a deepcopy default.)
+        """
+        if self._streaming:
+            raise TypeError(f"Cannot copy a streaming {self.__class__.__name__} (stream_path={self._stream_path}); "
+                            f"record the interactions in memory to copy game masters, e.g. for branching.")
+        _copy = type(self).__new__(self.__class__)
+        memo[id(self)] = _copy
+        for key, value in self.__dict__.items():
+            setattr(_copy, key, copy.deepcopy(value, memo))
+        return _copy
+
+    @property
+    def stream_path(self) -> Optional[str]:
+        """The path to the interactions.jsonl file, if streaming; otherwise None."""
+        return self._stream_path
+
+    @property
+    def tail(self) -> List[Dict]:
+        """The last few recorded events (with ISO format timestamps), if streaming; otherwise an empty list."""
+        if self._tail is None:
+            return []
+        return [_with_isoformat_timestamp(json.loads(line)["event"]) for line in self._tail]
+
+    @property
+    def interactions(self) -> Dict:
+        """Deprecated: Use to_dict() to read and log_key() or log_player() to change the recorded interactions.
+
+        The interactions are no longer kept as a dict, so this is a snapshot built by to_dict() on each access.
+        """
+        warnings.warn("GameInteractionsRecorder.interactions is deprecated and only returns a snapshot "
+                      "(changes to it are not recorded); use to_dict() instead", DeprecationWarning, stacklevel=2)
+        return self.to_dict()
+
+    def to_dict(self) -> Dict:
+        """Return the interactions in the format stored as interactions.json, that is, with ISO format timestamps.
+
+        Note: When streaming, the turns are read back from the stream file, that is, only on request.
+        To store a streamed interactions.json without reading all turns into memory, use store_interactions().
+        """
+        if self._streaming:
+            if self._stream is not None:
+                self._stream.flush()
+            turns = _read_stream_turns(self._stream_path, self._current_round + 1)
+        else:
+            turns = [[event.to_dict() for event in turn] for turn in self._turns]
+        # keep the key order of the interactions.json, that is, turns directly after players
+        return _with_turns(self._interactions, turns)
 
     def log_game_end(self, auto_count_logging: bool = True):
-        for name in self.interactions["players"]:
+        for name in self._interactions["players"]:
             """The transcript builder relies on specific player identifiers."""
             try:
                 assert name == "GM" or name.startswith("Player ")
             except AssertionError:
                 module_logger.warning(f"Invalid player identifiers, html builder won't work.")
-        if not self.interactions["turns"]:
+        if not self._streaming and not self._turns:
             module_logger.warning(f"Interaction logs are missing!")
 
         # games ending in round 0 never call log_next_round, so set round_count here
-        self.interactions["meta"]["round_count"] = self._current_round + 1
-        self.interactions["meta"]["completed"] = True
+        self._interactions["meta"]["round_count"] = self._current_round + 1
+        self._interactions["meta"]["completed"] = True
+
+        self._drain_pending_counts()
 
         # add default framework metrics
         if auto_count_logging:
@@ -121,6 +368,15 @@ class GameInteractionsRecorder(GameEventLogger):
             self.log_key(METRIC_REQUEST_COUNT_VIOLATED, self.violated_requests_counts)
             self.log_key(METRIC_REQUEST_COUNT_PARSED, self.successful_requests_counts)
 
+    def close(self):
+        """Write the trailer with all non-turn interactions entries and close the stream (if streaming)."""
+        if self._stream is None:
+            return
+        self._stream.write(json.dumps(dict(trailer=self._interactions), ensure_ascii=False))
+        self._stream.write("\n")
+        self._stream.close()
+        self._stream = None
+
 
 class EventCallRecorder(GameEventLogger):
     """ This recorder listens to events and records their call objects, if given."""
@@ -141,7 +397,7 @@ class EventCallRecorder(GameEventLogger):
         self.player_name = player_name
         self.game_role = game_role
         self.model_name = model_name
-        self.requests: dict = {
+        self._requests: dict = {
             "meta": {
                 "game_name": game_name,
                 "experiment_name": experiment_name,
@@ -157,31 +413,49 @@ class EventCallRecorder(GameEventLogger):
         self.round = 0
 
     def __len__(self) -> int:
-        return len(self.requests["calls"])
+        return len(self._requests["calls"])
 
     def log_event(self, from_: str, to: str, action: Dict, call: Tuple[Any, Any] = None):
         if from_ != self.player_name:  # only record events from this player
             return
-        timestamp = datetime.now().isoformat()
         if isinstance(call, tuple):
+            timestamp = time.time_ns()  # converted to ISO format only on serialization, see to_dict()
             call_obj = {
                 "timestamp": timestamp,
-                "manipulated_prompt_obj": copy.deepcopy(call[0]),
-                "raw_response_obj": copy.deepcopy(call[1])
+                "manipulated_prompt_obj": _copy_call_obj(call[0]),
+                "raw_response_obj": _copy_call_obj(call[1])
             }
-            self.requests["calls"].append(dict(round=self.round, call=call_obj))
-            module_logger.debug(f"{self.game_name}: Logged a call with timestamp {timestamp}")
+            self._requests["calls"].append(dict(round=self.round, call=call_obj))
+            if module_logger.isEnabledFor(logging.DEBUG):
+                module_logger.debug("%s: Logged a call with timestamp %s", self.game_name, timestamp)
+
+    @property
+    def requests(self) -> Dict:
+        """Deprecated: Use to_dict() to read the recorded requests.
+
+        The recorded calls keep their time.time_ns() timestamps internally, so this is a snapshot (with ISO format
+        timestamps) built by to_dict() on each access.
+        """
+        warnings.warn("EventCallRecorder.requests is deprecated and only returns a snapshot "
+                      "(changes to it are not recorded); use to_dict() instead", DeprecationWarning, stacklevel=2)
+        return self.to_dict()
+
+    def to_dict(self) -> Dict:
+        """Return the requests in the format stored as requests.json, that is, with ISO format timestamps."""
+        calls = [dict(round=entry["round"], call=_with_isoformat_timestamp(entry["call"]))
+                 for entry in self._requests["calls"]]
+        return {**self._requests, "calls": calls}
 
     def log_next_round(self):
         # keep track of round count during gameplay, because log_game_end might not be called when errors occur
         self.round += 1
-        self.requests["meta"]["round_count"] = self.round + 1
+        self._requests["meta"]["round_count"] = self.round + 1
 
     def log_game_end(self, auto_count_logging: bool = True):
         # games ending in round 0 never call log_next_round, so in this case we have to set it here
-        self.requests["meta"]["round_count"] = self.round + 1
+        self._requests["meta"]["round_count"] = self.round + 1
         # the game was ended properly by the game master
-        self.requests["meta"]["completed"] = True
+        self._requests["meta"]["completed"] = True
 
     def count_request(self):
         pass
@@ -6,11 +6,18 @@ from types import SimpleNamespace
 import logging
 import nltk
 
+from clemcore.clemgame.resources import parse_json
+
 logger = logging.getLogger(__name__)
 stdout_logger = logging.getLogger("clemcore.cli")
 
 ENV_CLEMBENCH_HOME = "CLEMBENCH_HOME"
 
+_MISSING = object()  # sentinel for attributes that are not set
+
+# directory names that never contain games, so the registry lookup does not descend into them
+_SKIPPED_DIRECTORIES = frozenset(["venv", "__pycache__", "docs", "in", "resources", "utils", "evaluation", "files"])
+
 
 class GameSpec(SimpleNamespace):
     """Base class for game specifications.
@@ -106,8 +113,8 @@ class GameSpec(SimpleNamespace):
     @classmethod
     def from_directory(cls, dir_path: str) -> List["GameSpec"]:
         file_path = os.path.join(dir_path, "clemgame.json")
-        with open(file_path, encoding='utf-8') as f:
-            game_spec = json.load(f)
+        with open(file_path, 'rb') as f:
+            game_spec = parse_json(f.read())
         game_specs = []
         if isinstance(game_spec, dict):
             game_spec["game_path"] = dir_path
@@ -140,14 +147,15 @@ class GameSpec(SimpleNamespace):
                 game-specifying dict.
         """
         for key, value in spec.items():
-            if not self.__contains__(key):
+            attribute = getattr(self, key, _MISSING)  # look up each attribute only once
+            if attribute is _MISSING:
                 raise KeyError(f"The specified key '{key}' for selecting games is not set in the game registry "
                                f"for game '{self['game_name']}'")
-            if type(self[key]) == str:
-                if not self[key] == value:
+            if type(attribute) == str:
+                if not attribute == value:
                     return False
-            elif type(self[key]) == list:
-                if value not in self[key]:
+            elif type(attribute) == list:
+                if value not in attribute:
                     return False
         return True
 
@@ -283,15 +291,13 @@ class GameRegistry:
                 game_specs = GameSpec.from_directory(current_directory)
                 self._game_specs.extend(game_specs)
                 return
-            for current_file in sorted(os.listdir(current_directory)):
-                file_path = os.path.join(current_directory, current_file)
-                if not os.path.isdir(file_path):
-                    continue
-                if current_file.startswith("."):
-                    continue
-                if current_file in ["venv", "__pycache__", "docs",
-                                    "in", "resources", "utils", "evaluation", "files"]:
-                    continue
+            with os.scandir(current_directory) as entries:
+                # scandir provides the file type from the directory listing, so the checks need no extra stat call
+                sub_directories = sorted((entry.name, entry.path) for entry in entries
+                                         if not entry.name.startswith(".")
+                                         and entry.name not in _SKIPPED_DIRECTORIES
+                                         and entry.is_dir())
+            for _, file_path in sub_directories:
                 self.register_from_directories(file_path, current_depth + 1, max_depth)
         except PermissionError:
             pass  # ignore
@@ -7,9 +7,31 @@ import os
 from pathlib import Path
 from typing import Dict, List, Union
 
+try:
+    import orjson  # optional: parses large json files (e.g. instances or results) considerably faster than json
+except ImportError:
+    orjson = None
+
 module_logger = logging.getLogger(__name__)
 
 
+def parse_json(data: Union[bytes, str]):
+    """Parse a JSON document, using orjson if available.
+    Falls back to the json module for documents orjson rejects. Those are mostly documents with NaN values,
+    which json.dump writes, for example, for the episode scores of aborted games.
+    Args:
+        data: The JSON document as bytes or string.
+    Returns:
+        The parsed JSON content.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 def store_file(data, file_name: str, dir_path: Union[str, Path], sub_dir: str = None, do_overwrite: bool = True) -> str:
     """Store a file.
     Base function to handle relative clembench directory paths.
@@ -61,8 +83,8 @@ def load_json(file_path: str) -> Dict:
     file_ending = ".json"
     if not file_path.endswith(file_ending):
         file_path = file_path + file_ending
-    with open(file_path, encoding='utf8') as f:
-        data = json.load(f)
+    with open(file_path, 'rb') as f:  # bytes can be parsed directly without decoding to str first
+        data = parse_json(f.read())
     return data
 
 
@@ -192,7 +214,7 @@ class GameResourceLocator(abc.ABC):
             The JSON file content as dict.
         """
         data = self.__load_game_file(file_path, file_ending=".json")
-        return json.loads(data)
+        return parse_json(data)
 
     def load_results_json(self, file_name: str, results_dir: str, dialogue_pair: str) -> Dict:
         """Load a .json file from the results directory for this game.
@@ -215,9 +237,9 @@ class GameResourceLocator(abc.ABC):
         if not file_name.endswith(file_ending):
             file_name = file_name + file_ending
         fp = os.path.join(results_dir, dialogue_pair, self.game_name, file_name)
-        with open(fp, encoding='utf8') as f:
+        with open(fp, 'rb') as f:
             data = f.read()
-        data = json.loads(data)
+        data = parse_json(data)
         return data
 
     def load_csv(self, file_name: str) -> List:
@@ -1,4 +1,5 @@
 import logging
+from itertools import islice
 from typing import List, Dict, Callable, Optional, Tuple, Any, Iterable
 
 from tqdm import tqdm
@@ -93,6 +94,7 @@ class SinglePassGameSessionPoller(Iterable):
         """
         self.game_sessions = game_sessions
         self.exhausted = [False] * len(game_sessions)
+        self._active = list(range(len(game_sessions)))  # indices of the sessions not known to be exhausted
 
     def __iter__(self):
         """
@@ -112,14 +114,15 @@ class SinglePassGameSessionPoller(Iterable):
                 - the Player object,
                 - and a context dictionary (Dict) representing the next observation.
         """
-        for i, session in enumerate(self.game_sessions):
-            if self.exhausted[i]:
-                continue
+        active = self._active
+        for i in active:
             try:
-                it = iter(session)
+                it = iter(self.game_sessions[i])
                 yield next(it)
             except StopIteration:
                 self.exhausted[i] = True
+        # After a full pass, drop the exhausted sessions, so that later passes do not visit them again
+        self._active = [i for i in active if not self.exhausted[i]]
 
 
 class DynamicBatchDataLoader(Iterable):
@@ -166,12 +169,8 @@ class DynamicBatchDataLoader(Iterable):
         while True:
             if all(self.dataset.exhausted):
                 break
-            batch_items = []
-            try:
-                for _ in range(self.batch_size):
-                    item = next(data_iter)
-                    batch_items.append(item)
-            except StopIteration:
+            batch_items = list(islice(data_iter, self.batch_size))
+            if len(batch_items) < self.batch_size:
                 # End of a pass or all sources exhausted; re-initialize for next round
                 data_iter = iter(self.dataset)
             if batch_items:
@@ -251,6 +250,7 @@ def __prepare_game_sessions(game_benchmark: GameBenchmark,
     if verbose:
         pbar = tqdm(total=len(game_instance_iterator), desc="Setup game instances", dynamic_ncols=True)
     for session_id, (experiment, game_instance) in enumerate(game_instance_iterator):
+        game_env = None
         try:
             game_env = GameMasterEnv(game_benchmark, callbacks=callbacks)
             game_env.reset(options={
@@ -263,6 +263,8 @@ def __prepare_game_sessions(game_benchmark: GameBenchmark,
             message = f"{game_benchmark.game_name}: Exception for instance {game_instance['game_id']} (but continue)"
             module_logger.exception(message)
             error_count += 1
+            if game_env is not None and game_env.game_master is not None:
+                callbacks.on_game_error(game_env.game_master, game_instance)
         if verbose:
             pbar.update(1)
     if verbose:
@@ -43,6 +43,8 @@ def run(game_benchmark: GameBenchmark,
             message = f"{game_benchmark.game_name}: Exception for instance {game_instance['game_id']} (but continue)"
             module_logger.exception(message)
             error_count += 1
+            if game_env.game_master is not None:
+                callbacks.on_game_error(game_env.game_master, game_instance)
             for model in player_models:
                 model.reset()
     game_env.close()
@@ -149,7 +149,8 @@ def run(game_selector: Union[str, Dict, GameSpec],
         instances_filename: str = None,
         results_dir_path: Path = None,
         sub_selector: Callable[[str, str], List[int]] = None,
-        batch_size: int = 1
+        batch_size: int = 1,
+        stream_interactions: bool = False
         ):
     """Run specific model/models with a specified clemgame.
     Args:
@@ -163,6 +164,8 @@ def run(game_selector: Union[str, Dict, GameSpec],
         sub_selector: A callable mapping from (game_name, experiment_name) tuples to lists of game instance ids.
             If a mapping returns None, then all game instances will be used.
         batch_size: A batch size to use for the run.
+        stream_interactions: Whether to append the recorded turns to a file during gameplay, instead of keeping
+            them in memory until the end of each game.
     """
     # check games
     game_registry = GameRegistry.from_directories_and_cwd_files()
@@ -178,7 +181,8 @@ def run(game_selector: Union[str, Dict, GameSpec],
     callbacks = GameBenchmarkCallbackList([
         InstanceFileSaver(results_folder),
         ExperimentFileSaver(results_folder, player_model_infos=model_infos),
-        InteractionsFileSaver(results_folder, player_model_infos=model_infos),
+        InteractionsFileSaver(results_folder, player_model_infos=model_infos,
+                              stream_interactions=stream_interactions),
         RunFileSaver(results_folder, player_model_infos=model_infos),
         PlayerFileSaver(results_folder)
     ])
@@ -335,7 +339,8 @@ def cli(args: argparse.Namespace):
                 experiment_name=args.experiment_name,
                 instances_filename=args.instances_filename,
                 results_dir_path=args.results_dir,
-                batch_size=args.batch_size)
+                batch_size=args.batch_size,
+                stream_interactions=args.stream_interactions)
         finally:
             logger.info("clem run took: %s", datetime.now() - start)
     if args.command_name == "serve":
@@ -435,6 +440,11 @@ Update Behavior:
                             help="A relative or absolute path to the results root directory. "
                                  "For example '-r results/v1.5/de‘ or '-r /absolute/path/for/results'. "
                                  "When not specified, then the results will be located in 'results'")
+    run_parser.add_argument("--stream_interactions", action="store_true",
+                            help="Append the recorded turns to an interactions.jsonl file during gameplay, "
+                                 "instead of keeping them in memory until the end of each game. "
+                                 "The file is converted into the interactions.json when the game ends. "
+                                 "Default: False.")
 
     score_parser = sub_parsers.add_parser("score")
     score_parser.add_argument("-g", "--game", type=str,
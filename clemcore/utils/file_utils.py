@@ -8,12 +8,17 @@ import csv
 
 ######### path construction functions ###################
 
+# the package location does not change at runtime, so we resolve the roots only once on import
+_CLEMCORE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_PROJECT_ROOT = os.path.dirname(_CLEMCORE_ROOT)
+
+
 def project_root():
     """Get the absolute path to main clembench directory.
     Returns:
          The absolute path to main clembench directory as string.
     """
-    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return _PROJECT_ROOT
 
 
 def clemcore_root():
@@ -21,7 +26,7 @@ def clemcore_root():
     Returns:
         The absolute path to the framework directory (clembench/framework) as string.
     """
-    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return _CLEMCORE_ROOT
 
 
 def results_root(results_dir: str) -> str:
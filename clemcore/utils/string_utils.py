@@ -2,6 +2,10 @@ import json
 import string
 from typing import Any, Optional
 
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+_TRUE_STRINGS = frozenset(("true", "yes", "on", "1"))
+_FALSE_STRINGS = frozenset(("false", "no", "off", "0"))
+
 
 def to_pretty_json(data: Any) -> str:
     """Format a dictionary or object as a pretty JSON string with proper newlines."""
@@ -16,13 +20,14 @@ def remove_punctuation(text: str) -> str:
     Returns:
         The passed string without punctuation.
     """
-    text = text.translate(str.maketrans("", "", string.punctuation))
+    text = text.translate(_PUNCTUATION_TABLE)
     return text
 
 
 def str_to_bool(s: str):
-    if s.lower() in ("true", "yes", "on", "1"): return True
-    if s.lower() in ("false", "no", "off", "0"): return False
+    s = s.lower()
+    if s in _TRUE_STRINGS: return True
+    if s in _FALSE_STRINGS: return False
     raise ValueError
 
 
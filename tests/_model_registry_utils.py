@@ -0,0 +1,54 @@
+"""Shared helpers for the model registry tests (test_model_registry*.py).
+
+These are plain module-level helpers instead of fixtures in a conftest.py, because they are needed where fixtures
+are not available: for the parametrize ids at collection time and in the unittest.TestCase.setUpClass methods.
+(A conftest.py is not meant to be imported directly.) The tests directory is put on the path via the pytest
+pythonpath option in pyproject.toml, so the import does not depend on pytest's import mode.
+
+Note: The cached registries are shared by all test modules, so tests must not mutate them.
+"""
+import functools
+import inspect
+from pathlib import Path
+
+from clemcore.backends import ModelRegistry
+
+# Backends to exclude from integration testing (require local GPU or specific setup)
+EXCLUDED_BACKENDS = {
+    "huggingface_local",
+    "huggingface_multimodal",
+    "vllm",
+    "openrouter",
+    "llamacpp",
+    "slurk"
+}
+
+
+def get_class_package_path(_class):
+    class_file = inspect.getfile(_class)
+    package_dir = Path(class_file).parent
+    if "site-packages" in str(package_dir):
+        print("WARNING: Loading registry from INSTALLED package, not local source!")
+    return package_dir
+
+
+@functools.lru_cache(maxsize=1)
+def get_local_model_registry():
+    """The registry of the packaged model specs (shared and cached; must not be mutated)."""
+    package_path = get_class_package_path(ModelRegistry)
+    return ModelRegistry.from_directory(package_path)
+
+
+@functools.lru_cache(maxsize=1)
+def get_testable_model_registry():
+    """The registry of the model specs to be tested (shared and cached; must not be mutated)."""
+    return get_local_model_registry().where(lambda spec: spec.backend not in EXCLUDED_BACKENDS)
+
+
+def get_local_model_specs():
+    return tuple(get_local_model_registry().model_specs)
+
+
+def get_testable_model_specs():
+    """Get model specs that should be tested (excluding certain backends)."""
+    return tuple(get_testable_model_registry().model_specs)
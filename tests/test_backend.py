@@ -1,8 +1,9 @@
+import copy
 import unittest
 
 import pytest
 
-from clemcore.backends import ModelRegistry, ModelSpec
+from clemcore.backends import CustomResponseModel, ModelRegistry, ModelSpec
 from clemcore.backends.anthropic_api import Anthropic
 from clemcore.backends.cohere_api import Cohere
 from clemcore.backends.google_api import Google
@@ -94,6 +95,20 @@ class MistralBackendTestCase(BackendTestCase):
         )
 
 
+class ModelDeepcopyTestCase(unittest.TestCase):
+
+    def test_deepcopy_has_own_gen_args(self):
+        model = CustomResponseModel(ModelSpec(model_name="mock"))
+        model.set_gen_arg("temperature", 0.0)
+
+        model_copy = copy.deepcopy(model)
+        model_copy.set_gen_arg("temperature", 1.0)
+
+        self.assertEqual(model.temperature, 0.0)
+        self.assertEqual(model_copy.temperature, 1.0)
+        self.assertIs(model_copy.model_spec, model.model_spec)
+
+
 class UtilsTestCase(unittest.TestCase):
 
     def test_ensure_alternating_roles_with_empty_system_removed_if_empty(self):
@@ -102,8 +117,9 @@ class UtilsTestCase(unittest.TestCase):
             {"role": "user", "content": "Initial Prompt"},
             {"role": "assistant", "content": "Turn 1"},
         ]
+        original_messages = copy.deepcopy(messages)
         _messages = ensure_alternating_roles(messages)
-        self.assertEqual(messages, messages)
+        self.assertEqual(messages, original_messages)  # input is untouched
         self.assertEqual(_messages, [
             {"role": "user", "content": "Initial Prompt"},
             {"role": "assistant", "content": "Turn 1"},
@@ -115,8 +131,9 @@ class UtilsTestCase(unittest.TestCase):
             {"role": "user", "content": "Initial Prompt"},
             {"role": "assistant", "content": "Turn 1"},
         ]
+        original_messages = copy.deepcopy(messages)
         _messages = ensure_alternating_roles(messages, cull_system_message=False)
-        self.assertEqual(messages, messages)
+        self.assertEqual(messages, original_messages)  # input is untouched
         self.assertEqual(_messages, messages)
 
     def test_ensure_alternating_roles_with_system_keeps_system(self):
@@ -125,8 +142,9 @@ class UtilsTestCase(unittest.TestCase):
             {"role": "user", "content": "Initial Prompt"},
             {"role": "assistant", "content": "Turn 1"},
         ]
+        original_messages = copy.deepcopy(messages)
         _messages = ensure_alternating_roles(messages)
-        self.assertEqual(messages, messages)
+        self.assertEqual(messages, original_messages)  # input is untouched
         self.assertEqual(_messages, messages)
 
     def test_ensure_alternating_roles_with_doubled_assistant(self):
@@ -135,8 +153,9 @@ class UtilsTestCase(unittest.TestCase):
             {"role": "assistant", "content": "Turn 1"},
             {"role": "assistant", "content": "Response 1"}
         ]
+        original_messages = copy.deepcopy(messages)
         _messages = ensure_alternating_roles(messages)
-        self.assertEqual(messages, messages)
+        self.assertEqual(messages, original_messages)  # input is untouched
         self.assertEqual(_messages, [
             {"role": "user", "content": "Initial Prompt"},
             {"role": "assistant", "content": "Turn 1\n\nResponse 1"}
@@ -149,8 +168,9 @@ class UtilsTestCase(unittest.TestCase):
             {"role": "user", "content": "Turn 1"},
             {"role": "assistant", "content": "Response 1"}
         ]
+        original_messages = copy.deepcopy(messages)
         _messages = ensure_alternating_roles(messages)
-        self.assertEqual(messages, messages)
+        self.assertEqual(messages, original_messages)  # input is untouched
         self.assertEqual(_messages, [
             {"role": "user", "content": "Initial Prompt\n\nTurn 1"},
             {"role": "assistant", "content": "Response 1"}
@@ -164,8 +184,9 @@ class UtilsTestCase(unittest.TestCase):
             {"role": "user", "content": "Turn 1b"},
             {"role": "assistant", "content": "Response 1"}
         ]
+        original_messages = copy.deepcopy(messages)
         _messages = ensure_alternating_roles(messages)
-        self.assertEqual(messages, messages)
+        self.assertEqual(messages, original_messages)  # input is untouched
         self.assertEqual(_messages, [
             {"role": "user", "content": "Initial Prompt\n\nTurn 1a\n\nTurn 1b"},
             {"role": "assistant", "content": "Response 1"}
@@ -179,14 +200,29 @@ class UtilsTestCase(unittest.TestCase):
             {"role": "assistant", "content": "Response 1"},
             {"role": "assistant", "content": "Turn 2"}
         ]
+        original_messages = copy.deepcopy(messages)
         _messages = ensure_alternating_roles(messages)
-        self.assertEqual(messages, messages)
+        self.assertEqual(messages, original_messages)  # input is untouched
         self.assertEqual(_messages, [
             {"role": "user", "content": "Initial Prompt\n\nTurn 1"},
             {"role": "assistant", "content": "Response 1\n\nTurn 2"}
         ]
                          )
 
+    def test_ensure_alternating_roles_with_doubled_user_keeps_input_and_extras(self):
+        messages = [
+            {"role": "user", "content": "Initial Prompt", "image": ["image.png"]},
+            {"role": "user", "content": "Turn 1"},
+            {"role": "assistant", "content": "Response 1"}
+        ]
+        _messages = ensure_alternating_roles(messages)
+        self.assertEqual(messages[0], {"role": "user", "content": "Initial Prompt", "image": ["image.png"]})
+        self.assertEqual(_messages, [
+            {"role": "user", "content": "Initial Prompt\n\nTurn 1", "image": ["image.png"]},
+            {"role": "assistant", "content": "Response 1"}
+        ])
+        self.assertIsNot(_messages[0]["image"], messages[0]["image"])
+
 
 MODELS_LIST = [
     {
@@ -212,19 +248,23 @@ MODELS_LIST = [
 
 
 class ModelTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the registry once; the tests only look up specs."""
+        cls.model_registry = ModelRegistry().register_from_list(MODELS_LIST)
+
     def test_get_backend_for_model1(self):
-        model_registry = ModelRegistry().register_from_list(MODELS_LIST)
-        model_spec = model_registry.get_first_model_spec_that_unify_with("model1")
+        model_spec = self.model_registry.get_first_model_spec_that_unify_with("model1")
         assert model_spec.backend == "huggingface_local"
 
     def test_get_backend_for_model2(self):
-        model_registry = ModelRegistry().register_from_list(MODELS_LIST)
-        model_spec = model_registry.get_first_model_spec_that_unify_with("model2")
+        model_spec = self.model_registry.get_first_model_spec_that_unify_with("model2")
         assert model_spec.backend == "huggingface_local"
 
     def test_get_backend_for_model1_other(self):
-        model_registry = ModelRegistry().register_from_list(MODELS_LIST)
-        model_spec = model_registry.get_first_model_spec_that_unify_with(dict(model_name="model1", backend="openai"))
+        model_spec = self.model_registry.get_first_model_spec_that_unify_with(
+            dict(model_name="model1", backend="openai"))
         assert model_spec.backend == "openai"
 
 
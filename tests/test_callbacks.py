@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from clemcore.clemgame.callbacks.base import GameBenchmarkCallback, GameBenchmarkCallbackList, GameStep
+from clemcore.clemgame.callbacks.files import InteractionsFileSaver, ResultsFolder
+from clemcore.clemgame.recorder import load_interactions
+from clemcore.clemgame.resources import load_json
+
+
+class StepCounter(GameBenchmarkCallback):
+
+    def __init__(self):
+        self.steps = 0
+
+    def on_game_step(self, game_master, game_instance, game_step):
+        self.steps += 1
+
+
+class GameBenchmarkCallbackListTestCase(unittest.TestCase):
+
+    def test_dispatches_to_overriding_callbacks(self):
+        counter = StepCounter()
+        callbacks = GameBenchmarkCallbackList([GameBenchmarkCallback(), counter])
+        callbacks.on_game_step(None, {}, GameStep({}, "response"))
+        callbacks.on_game_end(None, {})
+        self.assertEqual(counter.steps, 1)
+
+    def test_changed_callbacks_are_dispatched(self):
+        first, second, third = StepCounter(), StepCounter(), StepCounter()
+        callbacks = GameBenchmarkCallbackList([first])
+        callbacks.on_game_step(None, {}, GameStep({}, "response"))
+        callbacks.callbacks.append(second)  # changing the public list in place
+        callbacks.on_game_step(None, {}, GameStep({}, "response"))
+        callbacks.callbacks = [third]  # replacing the public list
+        callbacks.on_game_step(None, {}, GameStep({}, "response"))
+        self.assertEqual([first.steps, second.steps, third.steps], [2, 1, 1])
+
+    def test_empty_list_dispatches_nothing(self):
+        GameBenchmarkCallbackList().on_game_end(None, {})
+
+    def test_append_updates_dispatch(self):
+        callbacks = GameBenchmarkCallbackList()
+        counter = StepCounter()
+        callbacks.append(counter)
+        self.assertEqual(callbacks.callbacks, [counter])
+        callbacks.on_game_step(None, {}, GameStep({}, "response"))
+        self.assertEqual(counter.steps, 1)
+
+    def test_mock_callbacks_are_dispatched(self):
+        callback = MagicMock()
+        callbacks = GameBenchmarkCallbackList([callback])
+        callbacks.on_game_end("master", {})
+        callback.on_game_end.assert_called_once_with("master", {})
+
+    def test_nested_lists_are_dispatched(self):
+        counter = StepCounter()
+        callbacks = GameBenchmarkCallbackList([GameBenchmarkCallbackList([counter])])
+        callbacks.on_game_step(None, {}, GameStep({}, "response"))
+        self.assertEqual(counter.steps, 1)
+
+
+class InteractionsFileSaverTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.results_folder = ResultsFolder(Path(self.tmp_dir.name), "run")
+        self.game_master = MagicMock()
+        self.game_master.game_spec.game_name = "test_game"
+        self.game_master.experiment = {"name": "test_experiment"}
+        self.game_master.get_players.return_value = []
+        self.game_instance = {"game_id": 1}
+        self.instance_dir_path = self.results_folder.to_instance_dir_path(self.game_master, self.game_instance)
+
+    def _play_game(self, saver: InteractionsFileSaver):
+        saver.on_game_start(self.game_master, self.game_instance)
+        recorder = self.game_master.register.call_args.args[0]
+        recorder.log_event("GM", "Player 1", {"type": "send message", "content": "r0"})
+        recorder.log_next_round()
+        recorder.log_event("Player 1", "GM", {"type": "get message", "content": "r1"})
+        recorder.log_game_end()
+        saver.on_game_end(self.game_master, self.game_instance)
+        return recorder
+
+    def test_stores_interactions(self):
+        self._play_game(InteractionsFileSaver(self.results_folder))
+        interactions = load_json(str(self.instance_dir_path / "interactions.json"))
+        self.assertEqual([[e["action"]["content"] for e in turn] for turn in interactions["turns"]], [["r0"], ["r1"]])
+
+    def test_stores_streamed_interactions_and_removes_stream_file(self):
+        recorder = self._play_game(InteractionsFileSaver(self.results_folder, stream_interactions=True))
+        self.assertEqual(recorder.stream_path, str(self.instance_dir_path / "interactions.jsonl"))
+        self.assertFalse(os.path.exists(recorder.stream_path))
+        interactions = load_json(str(self.instance_dir_path / "interactions.json"))
+        self.assertEqual([[e["action"]["content"] for e in turn] for turn in interactions["turns"]], [["r0"], ["r1"]])
+        self.assertTrue(interactions["meta"]["completed"])
+        self.assertEqual(interactions["Request Count"], [0, 0])
+
+    def test_closes_streamed_interactions_on_game_error(self):
+        saver = InteractionsFileSaver(self.results_folder, stream_interactions=True)
+        saver.on_game_start(self.game_master, self.game_instance)
+        recorder = self.game_master.register.call_args.args[0]
+        recorder.log_event("GM", "Player 1", {"type": "send message", "content": "r0"})
+        saver.on_game_error(self.game_master, self.game_instance)
+        self.assertEqual(saver._recorders, {})
+        self.assertFalse(os.path.exists(self.instance_dir_path / "interactions.json"))
+        interactions = load_interactions(recorder.stream_path)  # the partial stream is closed with a trailer
+        self.assertEqual(interactions["meta"]["game_id"], 1)
+        self.assertIsNone(interactions["meta"]["completed"])
+        self.assertEqual([[e["action"]["content"] for e in turn] for turn in interactions["turns"]], [["r0"]])
+
+    def test_game_error_before_game_start_is_ignored(self):
+        saver = InteractionsFileSaver(self.results_folder, stream_interactions=True)
+        saver.on_game_error(self.game_master, self.game_instance)
+        self.assertEqual(saver._recorders, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
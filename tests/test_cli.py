@@ -21,5 +21,16 @@ class CLIExceptionLoggingTestCase(unittest.TestCase):
                 mock_logger.exception.assert_called_once()
 
 
+class CLIRunArgumentsTestCase(unittest.TestCase):
+
+    def test_stream_interactions_is_passed_to_run(self):
+        for extra_args, expected in [([], False), (["--stream_interactions"], True)]:
+            with self.subTest(extra_args=extra_args):
+                test_args = ["clem", "run", "-g", "taboo", "-m", "mock"] + extra_args
+                with patch("sys.argv", test_args), patch("clemcore.cli.run") as mock_run:
+                    main()
+                self.assertIs(mock_run.call_args.kwargs["stream_interactions"], expected)
+
+
 if __name__ == "__main__":
     unittest.main()
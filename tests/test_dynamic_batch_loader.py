@@ -171,6 +171,33 @@ class SinglePassGameSessionPollerTestCase(unittest.TestCase):
         self.assertFalse(poller.exhausted[0])
         self.assertTrue(poller.exhausted[1])
 
+    def test_exhausted_sessions_are_not_polled_again(self):
+        """Test that sessions found exhausted in a pass are not visited at all in later passes."""
+
+        class LookupCountingList(list):
+            def __init__(self, values):
+                super().__init__(values)
+                self.lookups = [0] * len(values)
+
+            def __getitem__(self, index):
+                self.lookups[index] += 1
+                return super().__getitem__(index)
+
+        env_done = MockGameMasterEnv(1, done_after=0)
+        env_done.terminations["player_0"] = True
+        sessions = [
+            GameSession(0, MockGameMasterEnv(0, done_after=5), {}),
+            GameSession(1, env_done, {}),
+        ]
+        poller = SinglePassGameSessionPoller(sessions)
+        poller.game_sessions = LookupCountingList(sessions)
+        list(poller)  # first pass finds session 1 exhausted
+        self.assertEqual(poller.game_sessions.lookups, [1, 1])
+
+        observations = list(poller) + list(poller)
+        self.assertEqual([obs[0] for obs in observations], [0, 0])
+        self.assertEqual(poller.game_sessions.lookups, [3, 1])  # the exhausted session is not looked up again
+
 
 class DynamicBatchDataLoaderTestCase(unittest.TestCase):
 
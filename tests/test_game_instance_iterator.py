@@ -28,6 +28,18 @@ class ToInstanceFilterTestCase(unittest.TestCase):
         result = filter_fn("game_b", "exp1")
         self.assertEqual(result, [1])
 
+    def test_filter_from_huggingface_dataset(self):
+        """Test creating filter from a columnar (huggingface) dataset."""
+        from datasets import Dataset
+        dataset = Dataset.from_list([
+            {"game": "game_a", "experiment": "exp1", "task_id": "1"},
+            {"game": "game_a", "experiment": "exp1", "task_id": "2"},
+            {"game": "game_b", "experiment": "exp1", "task_id": "1"},
+        ])
+        filter_fn = to_instance_filter(dataset)
+        self.assertEqual(filter_fn("game_a", "exp1"), [1, 2])
+        self.assertEqual(filter_fn("game_b", "exp1"), [1])
+
     def test_filter_returns_empty_for_missing(self):
         """Test that filter returns empty list for missing game/experiment."""
         dataset = [{"game": "game_a", "experiment": "exp1", "task_id": "1"}]
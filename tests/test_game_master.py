@@ -0,0 +1,84 @@
+import copy
+import unittest
+from typing import Dict
+
+from clemcore.backends import CustomResponseModel, ModelSpec
+from clemcore.clemgame.master import DialogueGameMaster
+from clemcore.clemgame.player import Player
+from clemcore.clemgame.recorder import GameInteractionsRecorder
+from clemcore.clemgame.registry import GameSpec
+
+
+class MockPlayer(Player):
+    """Mock player for testing - named to avoid pytest collection."""
+
+    def _custom_response(self, context: Dict) -> str:
+        return "custom response"
+
+
+class MockGameMaster(DialogueGameMaster):
+    """Minimal game master for testing - named to avoid pytest collection."""
+
+    def _on_setup(self, **kwargs):
+        for model in self.player_models:
+            self.add_player(MockPlayer(model), initial_context="Hi")
+
+    def _parse_response(self, player: Player, response: str) -> str:
+        return response
+
+    def _advance_game(self, player: Player, parsed_response: str):
+        pass
+
+    def _does_game_proceed(self) -> bool:
+        return True
+
+    def compute_turn_score(self) -> float:
+        return 0.
+
+    def compute_episode_score(self) -> float:
+        return 0.
+
+
+class GameMasterDeepcopyTestCase(unittest.TestCase):
+    """Tests for GameMaster deepcopy behavior."""
+
+    def setUp(self):
+        game_spec = GameSpec(game_name="test_game", game_path="/path", players=2)
+        model = CustomResponseModel(ModelSpec(model_name="mock"))
+        self.game_master = MockGameMaster(game_spec, {"name": "exp", "param": [1]}, [model])
+        self.recorder = GameInteractionsRecorder("test_game", "exp", 0, "results", {})
+        self.game_master.register(self.recorder)
+        self.game_master.setup()
+
+    def test_deepcopy_shares_game_spec_and_player_models(self):
+        gm_copy = copy.deepcopy(self.game_master)
+
+        self.assertIs(gm_copy.game_spec, self.game_master.game_spec)
+        self.assertIs(gm_copy.player_models, self.game_master.player_models)
+        self.assertIs(gm_copy.game_resources, self.game_master.game_resources)
+
+    def test_deepcopy_copies_players(self):
+        gm_copy = copy.deepcopy(self.game_master)
+
+        for player, player_copy in zip(self.game_master.get_players(), gm_copy.get_players()):
+            self.assertIsNot(player_copy, player)
+            self.assertIs(player_copy.model, player.model)
+        self.assertIs(gm_copy.current_player, gm_copy.get_players()[0])
+
+    def test_deepcopy_copies_loggers(self):
+        gm_copy = copy.deepcopy(self.game_master)
+
+        self.assertIsNot(gm_copy._loggers[0], self.recorder)
+        gm_copy.log_to_self("copy only", "value")
+        self.assertEqual(self.recorder.to_dict()["turns"], [[]])
+        self.assertEqual(len(gm_copy._loggers[0].to_dict()["turns"][0]), 1)
+
+    def test_deepcopy_copies_experiment(self):
+        gm_copy = copy.deepcopy(self.game_master)
+
+        gm_copy.experiment["param"].append(2)
+        self.assertEqual(self.game_master.experiment["param"], [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
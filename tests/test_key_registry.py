@@ -1,5 +1,4 @@
 import json
-import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -171,26 +170,15 @@ class KeyRegistryTestCase(unittest.TestCase):
             with open(key_file, "w") as f:
                 json.dump(key_data, f)
 
-            # Change to temp directory to test cwd lookup
-            old_cwd = os.getcwd()
-            try:
-                os.chdir(tmpdir)
-                registry = KeyRegistry.from_json()
-                self.assertEqual(registry["openai"].api_key, "loaded_key")
-            finally:
-                os.chdir(old_cwd)
+            registry = KeyRegistry.from_json(search_dir=Path(tmpdir))
+            self.assertEqual(registry["openai"].api_key, "loaded_key")
 
     def test_registry_from_json_fallback_empty(self):
         """Test that loading from non-existent file returns empty registry."""
         with tempfile.TemporaryDirectory() as tmpdir:
-            old_cwd = os.getcwd()
-            try:
-                os.chdir(tmpdir)
-                # No key.json exists, should return empty registry
-                registry = KeyRegistry.from_json(fallback=False)
-                self.assertEqual(len(registry), 0)
-            finally:
-                os.chdir(old_cwd)
+            # No key.json exists, should return empty registry
+            registry = KeyRegistry.from_json(search_dir=Path(tmpdir), fallback=False)
+            self.assertEqual(len(registry), 0)
 
     def test_registry_iteration(self):
         """Test iterating over registry keys."""
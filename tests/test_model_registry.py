@@ -3,41 +3,11 @@
 Tests that all models in model_registry.json (except huggingface, vllm, openrouter, llamacpp)
 can be loaded and their backends instantiated.
 """
-import inspect
 import unittest
-from pathlib import Path
 
 from clemcore.backends import ModelRegistry
 
-# Backends to exclude from integration testing (require local GPU or specific setup)
-EXCLUDED_BACKENDS = {
-    "huggingface_local",
-    "huggingface_multimodal",
-    "vllm",
-    "openrouter",
-    "llamacpp",
-    "slurk"
-}
-
-
-def get_class_package_path(_class):
-    class_file = inspect.getfile(_class)
-    package_dir = Path(class_file).parent
-    if "site-packages" in str(package_dir):
-        print("WARNING: Loading registry from INSTALLED package, not local source!")
-    return package_dir
-
-
-def get_local_model_specs():
-    package_path = get_class_package_path(ModelRegistry)
-    registry = ModelRegistry.from_directory(package_path)
-    return registry.model_specs
-
-
-def get_testable_model_specs():
-    """Get model specs that should be tested (excluding certain backends)."""
-    model_specs = get_local_model_specs()
-    return [spec for spec in model_specs if spec.backend not in EXCLUDED_BACKENDS]
+from _model_registry_utils import EXCLUDED_BACKENDS, get_local_model_specs, get_testable_model_specs
 
 
 class TestPackagedModelRegistry(unittest.TestCase):
@@ -5,40 +5,11 @@ can be loaded via the ModelRegistry and successfully generate responses.
 
 Run with: pytest -m api tests/test_model_registry_integration.py -v
 """
-import inspect
-from pathlib import Path
-
 import pytest
 
-from clemcore.backends import ModelRegistry
 from clemcore.backends.backend_registry import BackendRegistry
 
-# Backends to exclude from integration testing (require local GPU or specific setup)
-EXCLUDED_BACKENDS = {
-    "huggingface_local",
-    "huggingface_multimodal",
-    "vllm",
-    "openrouter",
-    "llamacpp",
-    "slurk"
-}
-
-
-def get_class_package_path(_class):
-    class_file = inspect.getfile(_class)
-    package_dir = Path(class_file).parent
-    if "site-packages" in str(package_dir):
-        print("WARNING: Loading registry from INSTALLED package, not local source!")
-    return package_dir
-
-
-def get_testable_model_registry():
-    package_path = get_class_package_path(ModelRegistry)
-    return ModelRegistry.from_directory(package_path).where(lambda spec: spec.backend not in EXCLUDED_BACKENDS)
-
-
-def get_testable_model_specs():
-    return get_testable_model_registry().model_specs
+from _model_registry_utils import get_class_package_path, get_testable_model_registry, get_testable_model_specs
 
 
 def get_model_ids():
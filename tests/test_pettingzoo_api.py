@@ -15,7 +15,7 @@ class PettingzooTestCase(unittest.TestCase):
     """
 
     def test_api(self):
-        api_test(env("taboo"), num_cycles=1000, verbose_progress=False)
+        api_test(env("taboo"), num_cycles=50, verbose_progress=False)
 
 
 if __name__ == '__main__':
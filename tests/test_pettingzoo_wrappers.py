@@ -17,6 +17,11 @@ class OrderAgentMappingTestCase(unittest.TestCase):
         ordered = order_agent_mapping_by_agent_id(mapping)
         self.assertEqual(list(ordered.keys()), ["player_0", "player_1", "player_2"])
 
+    def test_orders_by_agent_number_beyond_ten_agents(self):
+        mapping = {f"player_{i}": i for i in reversed(range(12))}
+        ordered = order_agent_mapping_by_agent_id(mapping)
+        self.assertEqual(list(ordered.keys()), [f"player_{i}" for i in range(12)])
+
 
 class AgentControlWrapperTestCase(unittest.TestCase):
 
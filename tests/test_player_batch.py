@@ -141,6 +141,27 @@ class PlayerDeepcopyTestCase(unittest.TestCase):
         self.assertEqual(len(player.get_perspective()), 1)
         self.assertEqual(len(player_copy.get_perspective()), 2)
 
+    def test_deepcopy_shares_memorized_messages(self):
+        player = MockPlayer(self.mock_model, name="Original")
+        player.perceive_context({"role": "user", "content": "Hi"}, log_event=False)
+
+        player_copy = copy.deepcopy(player)
+
+        # The history list is copied, but the (never changed) messages in it are shared
+        self.assertIsNot(player_copy.get_perspective(), player.get_perspective())
+        self.assertIs(player_copy.get_perspective()[0], player.get_perspective()[0])
+
+    def test_deepcopy_shallow_copies_model_held_elsewhere(self):
+        model = CustomResponseModel(ModelSpec(model_name="mock"))
+        player = MockPlayer(model, name="Original")
+        player.helper_models = [model]  # e.g. a game-specific player keeping another model reference
+
+        player_copy = copy.deepcopy(player)
+
+        self.assertIs(player_copy.model, model)
+        self.assertIsNot(player_copy.helper_models[0], model)
+        self.assertIs(player_copy.helper_models[0].model_spec, model.model_spec)
+
     def test_deepcopy_copies_name(self):
         player = MockPlayer(self.mock_model, name="Original")
         player_copy = copy.deepcopy(player)
@@ -226,6 +247,24 @@ class BatchResponseTestCase(unittest.TestCase):
         self.assertEqual(result[1][1], "resp1")
         self.assertEqual(result[2][1], "resp2")
 
+    def test_shared_model_batched_together_for_many_players(self):
+        for n in [2, 8, 64]:
+            with self.subTest(n=n):
+                model = MagicMock()
+                model.name = "shared_model"
+                model.generate_batch_response.return_value = [
+                    ([{"role": "user", "content": f"ctx{i}"}], {}, f"resp{i}") for i in range(n)
+                ]
+                players = [MockPlayer(model) for _ in range(n)]
+                contexts = [{"role": "user", "content": f"ctx{i}"} for i in range(n)]
+
+                result = Player.batch_response(players, contexts, row_ids=list(range(n)))
+
+                # Still a single model call, regardless of the number of players
+                model.generate_batch_response.assert_called_once()
+                self.assertEqual(len(model.generate_batch_response.call_args.args[0]), n)
+                self.assertEqual([result[i][1] for i in range(n)], [f"resp{i}" for i in range(n)])
+
     def test_mismatched_players_contexts_raises(self):
         player, _ = self._make_player_with_mock("model", [])
 
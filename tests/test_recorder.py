@@ -1,6 +1,13 @@
+import copy
+import json
+import os
+import tempfile
 import unittest
+from datetime import datetime
 
-from clemcore.clemgame.recorder import GameInteractionsRecorder, EventCallRecorder
+from clemcore.clemgame.events import GameEventSource
+from clemcore.clemgame.recorder import GameInteractionsRecorder, EventCallRecorder, load_interactions, \
+    store_interactions
 
 
 class TestGameInteractionsRecorder(unittest.TestCase):
@@ -16,21 +23,21 @@ class TestGameInteractionsRecorder(unittest.TestCase):
 
     def test_initial_meta_fields(self):
         """round_count and completed should be None initially."""
-        meta = self.recorder.interactions["meta"]
+        meta = self.recorder.to_dict()["meta"]
         self.assertIsNone(meta["round_count"])
         self.assertIsNone(meta["completed"])
 
     def test_log_next_round_updates_round_count(self):
         """log_next_round should update round_count in meta."""
         self.recorder.log_next_round()
-        self.assertEqual(self.recorder.interactions["meta"]["round_count"], 2)
+        self.assertEqual(self.recorder.to_dict()["meta"]["round_count"], 2)
         self.recorder.log_next_round()
-        self.assertEqual(self.recorder.interactions["meta"]["round_count"], 3)
+        self.assertEqual(self.recorder.to_dict()["meta"]["round_count"], 3)
 
     def test_log_game_end_sets_completed(self):
         """log_game_end should set completed=True and round_count."""
         self.recorder.log_game_end()
-        meta = self.recorder.interactions["meta"]
+        meta = self.recorder.to_dict()["meta"]
         self.assertTrue(meta["completed"])
         self.assertEqual(meta["round_count"], 1)
 
@@ -39,10 +46,135 @@ class TestGameInteractionsRecorder(unittest.TestCase):
         self.recorder.log_next_round()
         self.recorder.log_next_round()
         self.recorder.log_game_end()
-        meta = self.recorder.interactions["meta"]
+        meta = self.recorder.to_dict()["meta"]
         self.assertTrue(meta["completed"])
         self.assertEqual(meta["round_count"], 3)
 
+    def test_to_dict_converts_timestamps(self):
+        """to_dict should return the events with ISO format timestamps."""
+        self.recorder.log_event("GM", "Player 1", {"type": "send message", "content": "hello"})
+        event = self.recorder.to_dict()["turns"][0][0]
+        self.assertIsInstance(event["timestamp"], str)
+        self.assertEqual(datetime.fromisoformat(event["timestamp"]).year, datetime.now().year)
+        self.assertEqual(event["action"]["content"], "hello")
+
+    def test_log_event_copies_action(self):
+        """Mutating a logged value afterwards should not change the recorded event."""
+        board = [1, 2]
+        self.recorder.log_event("GM", "GM", {"type": "board", "content": {"board": board}})
+        board.append(3)
+        event = self.recorder.to_dict()["turns"][0][0]
+        self.assertEqual(event["action"]["content"], {"board": [1, 2]})
+
+    def test_interactions_are_json_serializable(self):
+        """The interactions should be plain dicts that can be stored as they are."""
+        self.recorder.log_event("GM", "Player 1", {"type": "send message", "content": "hello"})
+        self.recorder.log_game_end()
+        interactions = json.loads(json.dumps(self.recorder.to_dict()))
+        self.assertEqual(list(interactions.keys())[:4], ["meta", "player_models", "players", "turns"])
+        self.assertEqual(interactions["turns"][0][0]["action"]["content"], "hello")
+        self.assertIsInstance(interactions["turns"][0][0]["timestamp"], str)
+
+    def test_interactions_attribute_is_deprecated(self):
+        """The interactions attribute is only a snapshot and warns about it."""
+        with self.assertWarns(DeprecationWarning):
+            interactions = self.recorder.interactions
+        self.assertEqual(interactions, self.recorder.to_dict())
+
+    def test_tail_is_empty_when_not_streaming(self):
+        """The tail is only kept when streaming."""
+        self.recorder.log_event("GM", "Player 1", {"type": "send message", "content": "hello"})
+        self.assertIsNone(self.recorder.stream_path)
+        self.assertEqual(self.recorder.tail, [])
+
+    def test_deepcopy_is_independent(self):
+        """A copy of an in-memory recorder should record independently of the original."""
+        self.recorder.log_event("GM", "Player 1", {"type": "send message", "content": "hello"})
+        recorder_copy = copy.deepcopy(self.recorder)
+        recorder_copy.log_event("GM", "Player 1", {"type": "send message", "content": "branch"})
+        self.assertEqual(len(self.recorder.to_dict()["turns"][0]), 1)
+        self.assertEqual(len(recorder_copy.to_dict()["turns"][0]), 2)
+
+
+class TestStreamingGameInteractionsRecorder(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.stream_path = os.path.join(self.tmp_dir.name, "interactions.jsonl")
+        self.recorder = GameInteractionsRecorder(
+            game_name="test_game",
+            experiment_name="test_experiment",
+            game_id=1,
+            results_folder="/tmp/results",
+            player_model_infos={"Player 1": {"model": "test-model"}},
+            stream_path=self.stream_path
+        )
+
+    def tearDown(self):
+        self.recorder.close()
+        self.tmp_dir.cleanup()
+
+    def test_turns_are_streamed_to_file(self):
+        """Streamed events should be written to the stream file and only the last events kept in the tail."""
+        self.recorder.log_event("GM", "Player 1", {"type": "send message", "content": "hello"})
+        self.assertEqual(self.recorder.stream_path, self.stream_path)
+        self.assertEqual([event["action"]["content"] for event in self.recorder.tail], ["hello"])
+        # the turns are read back from the stream file on request
+        self.assertEqual(self.recorder.to_dict()["turns"][0][0]["action"]["content"], "hello")
+
+    def test_streaming_recorder_cannot_be_copied(self):
+        """Copies of a streaming recorder would write to the same file, so copying is refused."""
+        with self.assertRaises(TypeError):
+            copy.deepcopy(self.recorder)
+
+    def test_store_interactions_matches_load_interactions(self):
+        """store_interactions should write the same interactions as load_interactions reconstructs."""
+        self.recorder.log_player("Player 1", "Guesser", "test-model")
+        self.recorder.log_event("GM", "Player 1", {"type": "send message", "content": "r0"})
+        self.recorder.log_event("Player 1", "GM", {"type": "get message", "content": "r0 ünïcode"})
+        self.recorder.log_next_round()
+        self.recorder.log_next_round()
+        self.recorder.log_event("GM", "GM", {"type": "board", "content": {"board": [1, 2]}})
+        self.recorder.log_next_round()
+        self.recorder.log_game_end()
+        self.recorder.close()
+        file_path = os.path.join(self.tmp_dir.name, "interactions.json")
+        store_interactions(self.stream_path, file_path)
+        with open(file_path, encoding="utf-8") as f:
+            stored = json.load(f)
+        self.assertEqual(stored, load_interactions(self.stream_path))
+        self.assertEqual(list(stored.keys()), list(load_interactions(self.stream_path).keys()))
+        self.assertEqual([len(turn) for turn in stored["turns"]], [2, 0, 1, 0])
+
+    def test_unclosed_stream_cannot_be_loaded(self):
+        """A stream file without trailer (the recorder was not closed) should not be loaded partially."""
+        self.recorder.log_event("GM", "Player 1", {"type": "send message", "content": "r0"})
+        self.recorder.log_next_round()  # flushes the stream
+        file_path = os.path.join(self.tmp_dir.name, "interactions.json")
+        with self.assertRaises(ValueError):
+            load_interactions(self.stream_path)
+        with self.assertRaises(ValueError):
+            store_interactions(self.stream_path, file_path)
+        self.recorder.close()
+
+    def test_load_interactions_restores_turns(self):
+        """load_interactions should reconstruct the same structure as the in-memory recorder."""
+        self.recorder.log_player("Player 1", "Guesser", "test-model")
+        self.recorder.log_event("GM", "Player 1", {"type": "send message", "content": "r0"})
+        self.recorder.log_next_round()
+        self.recorder.log_next_round()
+        self.recorder.log_event("Player 1", "GM", {"type": "get message", "content": "r2"})
+        self.recorder.log_game_end()
+        self.recorder.close()
+        interactions = load_interactions(self.stream_path)
+        self.assertEqual(list(interactions.keys())[:4], ["meta", "player_models", "players", "turns"])
+        self.assertEqual(interactions["meta"]["round_count"], 3)
+        self.assertTrue(interactions["meta"]["completed"])
+        self.assertEqual([len(turn) for turn in interactions["turns"]], [1, 0, 1])
+        self.assertEqual(interactions["turns"][2][0]["action"]["content"], "r2")
+        self.assertIsInstance(interactions["turns"][2][0]["timestamp"], str)
+        self.assertIn("Player 1", interactions["players"])
+
 
 class TestEventCallRecorder(unittest.TestCase):
 
@@ -58,7 +190,7 @@ class TestEventCallRecorder(unittest.TestCase):
 
     def test_initial_state(self):
         """Recorder should initialize with correct metadata and empty calls."""
-        meta = self.recorder.requests["meta"]
+        meta = self.recorder.to_dict()["meta"]
         self.assertEqual(meta["game_name"], "test_game")
         self.assertEqual(meta["experiment_name"], "test_experiment")
         self.assertEqual(meta["game_id"], 1)
@@ -67,7 +199,7 @@ class TestEventCallRecorder(unittest.TestCase):
         self.assertEqual(meta["model_name"], "test-model")
         self.assertIsNone(meta["round_count"])
         self.assertIsNone(meta["completed"])
-        self.assertEqual(self.recorder.requests["calls"], [])
+        self.assertEqual(self.recorder.to_dict()["calls"], [])
         self.assertEqual(len(self.recorder), 0)
 
     def test_log_event_filters_by_player_name(self):
@@ -99,7 +231,7 @@ class TestEventCallRecorder(unittest.TestCase):
             call=({"prompt": "test"}, {"response": "test"})
         )
         self.assertEqual(len(self.recorder), 1)
-        call_entry = self.recorder.requests["calls"][0]
+        call_entry = self.recorder.to_dict()["calls"][0]
         self.assertEqual(call_entry["round"], 0)
         self.assertIn("timestamp", call_entry["call"])
         self.assertEqual(call_entry["call"]["manipulated_prompt_obj"], {"prompt": "test"})
@@ -130,10 +262,10 @@ class TestEventCallRecorder(unittest.TestCase):
         self.assertEqual(self.recorder.round, 0)
         self.recorder.log_next_round()
         self.assertEqual(self.recorder.round, 1)
-        self.assertEqual(self.recorder.requests["meta"]["round_count"], 2)
+        self.assertEqual(self.recorder.to_dict()["meta"]["round_count"], 2)
         self.recorder.log_next_round()
         self.assertEqual(self.recorder.round, 2)
-        self.assertEqual(self.recorder.requests["meta"]["round_count"], 3)
+        self.assertEqual(self.recorder.to_dict()["meta"]["round_count"], 3)
 
     def test_log_event_uses_current_round(self):
         """log_event should tag calls with the current round number."""
@@ -148,26 +280,54 @@ class TestEventCallRecorder(unittest.TestCase):
             action={"type": "get message", "content": "r1"},
             call=({"p": 2}, {"r": 2})
         )
-        self.assertEqual(self.recorder.requests["calls"][0]["round"], 0)
-        self.assertEqual(self.recorder.requests["calls"][1]["round"], 1)
+        self.assertEqual(self.recorder.to_dict()["calls"][0]["round"], 0)
+        self.assertEqual(self.recorder.to_dict()["calls"][1]["round"], 1)
+
+    def test_to_dict_converts_timestamps(self):
+        """to_dict should return the calls with ISO format timestamps."""
+        self.recorder.log_event(
+            from_="Player 1", to="GM",
+            action={"type": "get message", "content": "hello"},
+            call=({"prompt": "test"}, {"response": "test"})
+        )
+        requests = self.recorder.to_dict()
+        self.assertIsInstance(requests["calls"][0]["call"]["timestamp"], str)
+        self.assertEqual(requests["calls"][0]["call"]["raw_response_obj"], {"response": "test"})
+        self.assertEqual(requests["meta"], self.recorder.to_dict()["meta"])
+
+    def test_requests_have_isoformat_timestamps(self):
+        """The requests should show the calls with ISO format timestamps."""
+        self.recorder.log_event(
+            from_="Player 1", to="GM",
+            action={"type": "get message", "content": "hello"},
+            call=({"prompt": "test"}, {"response": "test"})
+        )
+        timestamp = self.recorder.to_dict()["calls"][0]["call"]["timestamp"]
+        self.assertEqual(datetime.fromisoformat(timestamp).year, datetime.now().year)
+
+    def test_requests_attribute_is_deprecated(self):
+        """The requests attribute is only a snapshot and warns about it."""
+        with self.assertWarns(DeprecationWarning):
+            requests = self.recorder.requests
+        self.assertEqual(requests, self.recorder.to_dict())
 
     def test_log_game_end_sets_completed(self):
         """log_game_end should set completed=True."""
-        self.assertIsNone(self.recorder.requests["meta"]["completed"])
+        self.assertIsNone(self.recorder.to_dict()["meta"]["completed"])
         self.recorder.log_game_end()
-        self.assertTrue(self.recorder.requests["meta"]["completed"])
+        self.assertTrue(self.recorder.to_dict()["meta"]["completed"])
 
     def test_log_game_end_sets_round_count(self):
         """log_game_end should set round_count even if log_next_round was never called."""
         self.recorder.log_game_end()
-        self.assertEqual(self.recorder.requests["meta"]["round_count"], 1)
+        self.assertEqual(self.recorder.to_dict()["meta"]["round_count"], 1)
 
     def test_log_game_end_after_rounds(self):
         """log_game_end should reflect correct round_count after multiple rounds."""
         self.recorder.log_next_round()
         self.recorder.log_next_round()
         self.recorder.log_game_end()
-        self.assertEqual(self.recorder.requests["meta"]["round_count"], 3)
+        self.assertEqual(self.recorder.to_dict()["meta"]["round_count"], 3)
 
     def test_deepcopy_in_log_event(self):
         """log_event should deepcopy call objects to prevent mutation issues."""
@@ -182,10 +342,28 @@ class TestEventCallRecorder(unittest.TestCase):
         prompt["messages"].append({"role": "assistant", "content": "mutated"})
         response["choices"].append({"text": "mutated"})
         # Recorded call should be unchanged
-        recorded = self.recorder.requests["calls"][0]["call"]
+        recorded = self.recorder.to_dict()["calls"][0]["call"]
         self.assertEqual(len(recorded["manipulated_prompt_obj"]["messages"]), 1)
         self.assertEqual(len(recorded["raw_response_obj"]["choices"]), 1)
 
 
+class TestFilteredRegistration(unittest.TestCase):
+
+    def test_register_with_origin_filter(self):
+        """Loggers registered for an origin should only receive events from that origin."""
+        source = GameEventSource()
+        recorder = EventCallRecorder("test_game", experiment_name="test_experiment", game_id=1,
+                                     player_name="Player 1", game_role="Guesser", model_name="test-model")
+        interactions_recorder = GameInteractionsRecorder("test_game", "test_experiment", 1, "/tmp/results", {})
+        source.register(recorder, from_="Player 1")
+        source.register(interactions_recorder)
+        source.log_event("Player 2", "GM", {"type": "get message", "content": "p2"}, call=({}, {}))
+        source.log_event("Player 1", "GM", {"type": "get message", "content": "p1"}, call=({}, {}))
+        source.log_next_round()  # lifecycle events are delegated regardless of the origin filter
+        self.assertEqual(len(recorder), 1)
+        self.assertEqual(recorder.round, 1)
+        self.assertEqual(len(interactions_recorder.to_dict()["turns"][0]), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,30 @@
+import json
+import math
+import os
+import tempfile
+import unittest
+
+from clemcore.clemgame.resources import load_json, parse_json, store_json
+
+
+class ParseJsonTestCase(unittest.TestCase):
+
+    def test_parse_bytes_and_str(self):
+        self.assertEqual(parse_json(b'{"a": [1, 2]}'), {"a": [1, 2]})
+        self.assertEqual(parse_json('{"a": [1, 2]}'), {"a": [1, 2]})
+
+    def test_parse_nan(self):
+        """json.dump writes NaN, e.g., for the episode scores of aborted games."""
+        data = parse_json(json.dumps({"score": float("nan")}))
+        self.assertTrue(math.isnan(data["score"]))
+
+    def test_load_stored_json(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store_json({"name": "äöü", "score": float("nan")}, "scores.json", tmpdir)
+            data = load_json(os.path.join(tmpdir, "scores"))
+        self.assertEqual(data["name"], "äöü")
+        self.assertTrue(math.isnan(data["score"]))
+
+
+if __name__ == '__main__':
+    unittest.main()